@@ -2,46 +2,196 @@
 Dependency injection utilities for FastAPI.
 """
 
+import asyncio
 import logging
+import os
+import pickle
+from functools import lru_cache
 from pathlib import Path
 
+import boto3
+from botocore.config import Config
 from graph import compile_graph
+from langgraph.checkpoint.base import BaseCheckpointSaver
 from langgraph.graph.state import CompiledStateGraph
+import faiss
 from langchain_community.vectorstores import FAISS
+from langchain_community.vectorstores.utils import DistanceStrategy
 from langchain_aws import BedrockEmbeddings
 
 logger = logging.getLogger(__name__)
 
 # Singleton graph instance
 _graph: CompiledStateGraph | None = None
+_graph_lock = asyncio.Lock()
 
 # Singleton FAISS index instance
 _ielts_index: FAISS | None = None
+_index_lock = asyncio.Lock()
 
 # Path to pre-built IELTS index
 IELTS_INDEX_PATH = Path(__file__).parent / "data" / "ielts_index"
 
-# Embedding model - must match the one used to build the index
+# Embedding model - must match the one used to build the index.
+# Indexes built with inner product expect L2-normalized vectors, so queries
+# are normalized the same way (see _load_faiss_index).
 EMBEDDING_MODEL_ID = "amazon.titan-embed-text-v2:0"
 
+# Candidates explored per HNSW query (only used for HNSW-built indexes).
+# Higher = better recall, slower search; TOP_K_RESULTS is 1, so 64 is ample.
+HNSW_EF_SEARCH = 64
 
-def get_graph() -> CompiledStateGraph:
+# Inverted lists probed per IVF query (only used for IVF-built indexes).
+# More probes = better recall, slower search.
+IVF_NPROBE = 8
+
+# Origin allowed when ALLOWED_ORIGINS is unset (Vite default port)
+DEFAULT_ALLOWED_ORIGIN = "http://localhost:5173"
+
+
+@lru_cache(maxsize=1)
+def get_allowed_origins() -> list[str]:
+    """
+    Get the origins allowed to call the API (read once, after load_dotenv).
+
+    Comma-separated ALLOWED_ORIGINS; the Vite dev server when unset. Shared by
+    the CORS middleware and the audio WebSocket, which CORS doesn't cover.
+    """
+    origins = os.getenv("ALLOWED_ORIGINS") or DEFAULT_ALLOWED_ORIGIN
+    return [o.strip().rstrip("/") for o in origins.split(",") if o.strip()]
+
+
+async def init_graph(checkpointer: BaseCheckpointSaver) -> CompiledStateGraph:
+    """
+    Compile the graph singleton around the server lifespan's checkpointer.
+
+    The lifespan owns the checkpointer (and closes it on shutdown); get_graph
+    then returns this graph to every request.
+    """
+    global _graph
+    async with _graph_lock:
+        _graph = await asyncio.to_thread(compile_graph, checkpointer)
+    return _graph
+
+
+async def get_graph() -> CompiledStateGraph:
     """
     Get the compiled LangGraph instance (singleton).
 
-    This ensures the same MemorySaver instance is used across all requests,
-    maintaining conversation persistence.
+    This ensures the same checkpointer is used across all requests,
+    maintaining conversation persistence. Normally compiled by init_graph at
+    startup; outside the server lifespan it compiles once with a MemorySaver,
+    using double-checked locking so concurrent requests never compile twice.
+
+    Callers must use the async graph API (astream, aget_state) so checkpointer
+    reads never block the event loop.
     """
     global _graph
-    if _graph is None:
-        _graph = compile_graph()
+    if _graph is not None:
+        return _graph
+
+    async with _graph_lock:
+        if _graph is None:
+            _graph = await asyncio.to_thread(compile_graph)
     return _graph
 
 
-def load_ielts_index() -> FAISS | None:
+@lru_cache(maxsize=1)
+def get_bedrock_client():
+    """
+    Get the shared Bedrock runtime client (created on first use).
+
+    Reused by every BedrockEmbeddings instance so credential resolution and
+    connection setup happen once, and concurrent embed calls share a pool.
+    """
+    return boto3.client(
+        "bedrock-runtime",
+        region_name=os.getenv("AWS_REGION") or os.getenv("AWS_DEFAULT_REGION"),
+        config=Config(
+            max_pool_connections=32,
+            retries={"mode": "adaptive"},
+        ),
+    )
+
+
+def _read_faiss_index(path: Path) -> faiss.Index:
+    """
+    Read a FAISS index file, memory-mapped when this faiss build supports it.
+
+    A read-only mapping lives in the OS page cache, so every Uvicorn worker
+    shares one copy of the vectors instead of each holding its own. Older
+    faiss builds (no IO_FLAG_MMAP_IFC) and index types it can't map are read
+    into memory as before.
+    """
+    mmap_flag = getattr(faiss, "IO_FLAG_MMAP_IFC", None)
+    if mmap_flag is not None:
+        try:
+            return faiss.read_index(str(path), mmap_flag | faiss.IO_FLAG_READ_ONLY)
+        except RuntimeError as e:
+            logger.info(f"FAISS index could not be memory-mapped, reading it: {e}")
+    return faiss.read_index(str(path))
+
+
+def _load_faiss_index() -> FAISS:
+    """Read the FAISS index from disk (blocking)."""
+    embeddings = BedrockEmbeddings(
+        client=get_bedrock_client(),
+        model_id=EMBEDDING_MODEL_ID,
+    )
+    # Same files FAISS.save_local writes; the pickle is our own build output
+    with open(IELTS_INDEX_PATH / "index.pkl", "rb") as f:
+        docstore, index_to_docstore_id = pickle.load(f)
+    vectorstore = FAISS(
+        embedding_function=embeddings,
+        index=_read_faiss_index(IELTS_INDEX_PATH / "index.faiss"),
+        docstore=docstore,
+        index_to_docstore_id=index_to_docstore_id,
+    )
+
+    # Inner-product indexes hold normalized vectors; match that for queries
+    if vectorstore.index.metric_type == faiss.METRIC_INNER_PRODUCT:
+        vectorstore.distance_strategy = DistanceStrategy.MAX_INNER_PRODUCT
+        vectorstore._normalize_L2 = True
+
+    hnsw = getattr(vectorstore.index, "hnsw", None)
+    if hnsw is not None:
+        hnsw.efSearch = HNSW_EF_SEARCH
+        # GPU FAISS has no HNSW index; the graph search is cheap on CPU
+        return vectorstore
+
+    ivf = faiss.try_extract_index_ivf(vectorstore.index)
+    if ivf is not None:
+        ivf.nprobe = IVF_NPROBE
+
+    _move_index_to_gpu(vectorstore)
+    return vectorstore
+
+
+def _move_index_to_gpu(vectorstore: FAISS) -> None:
+    """
+    Move the FAISS index onto the first GPU when one is available.
+
+    No-op on CPU-only hosts and with faiss-cpu builds.
+    """
+    try:
+        if faiss.get_num_gpus() < 1:
+            return
+        gpu_resources = faiss.StandardGpuResources()
+        vectorstore.index = faiss.index_cpu_to_gpu(
+            gpu_resources, 0, vectorstore.index)
+        # Keep the resources alive as long as the index uses them
+        vectorstore._gpu_resources = gpu_resources
+        logger.info("IELTS FAISS index moved to GPU")
+    except Exception as e:
+        logger.info(f"FAISS GPU not available, using CPU index: {e}")
+
+
+async def load_ielts_index() -> FAISS | None:
     """
     Load the pre-built FAISS index for IELTS vocabulary.
 
+    Guarded by a lock so concurrent callers share a single load.
+
     Returns:
         FAISS index if loaded successfully, None otherwise
     """
@@ -54,24 +204,26 @@ def load_ielts_index() -> FAISS | None:
         logger.warning(f"IELTS index not found at {IELTS_INDEX_PATH}")
         return None
 
-    try:
-        embeddings = BedrockEmbeddings(model_id=EMBEDDING_MODEL_ID)
-        _ielts_index = FAISS.load_local(
-            str(IELTS_INDEX_PATH),
-            embeddings,
-            allow_dangerous_deserialization=True
-        )
-        logger.info(f"IELTS FAISS index loaded from {IELTS_INDEX_PATH}")
-        return _ielts_index
-    except Exception as e:
-        logger.error(f"Failed to load IELTS index: {e}")
-        return None
+    async with _index_lock:
+        if _ielts_index is not None:
+            return _ielts_index
+
+        try:
+            _ielts_index = await asyncio.to_thread(_load_faiss_index)
+            logger.info(f"IELTS FAISS index loaded from {IELTS_INDEX_PATH}")
+            return _ielts_index
+        except Exception as e:
+            logger.error(f"Failed to load IELTS index: {e}")
+            return None
 
 
 def get_ielts_index() -> FAISS | None:
     """
     Get the IELTS FAISS index (singleton).
 
+    The index is populated once at startup by load_ielts_index(); this getter
+    never loads from disk on the request path.
+
     Returns:
         FAISS index if available, None otherwise (graceful degradation)
     """
@@ -3,31 +3,51 @@ Chat and summary endpoints with SSE streaming.
 """
 
 import asyncio
-import json
+import base64
+import hashlib
+import itertools
 import logging
-import uuid
+import secrets
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable, Iterator
+from functools import lru_cache
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, File, Form, UploadFile
-from fastapi.responses import StreamingResponse
+import orjson
+from anthropic import AsyncAnthropic
+from fastapi import APIRouter, Depends, File, Form, Header, UploadFile, WebSocket
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from langchain_anthropic import ChatAnthropic
 from langchain_community.vectorstores import FAISS
-from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
 from langchain_core.runnables import RunnableConfig
+from langchain_core.utils.json import parse_partial_json
 from langgraph.graph.state import CompiledStateGraph
-from openai import OpenAI
 
-from dependencies import get_graph, get_ielts_index
-from ielts_rag import run_ielts_rag_pipeline
+from dependencies import get_allowed_origins, get_graph, get_ielts_index
+from graph import get_openai_client
+from ielts_rag import (
+    USAGE_MAX_TOKENS,
+    USAGE_MODEL,
+    USAGE_SYSTEM_PROMPT,
+    USAGE_TEMPERATURE,
+    find_vocabulary_matches,
+    parse_usage_explanations,
+    run_ielts_rag_pipeline,
+    stream_ielts_rag_pipeline,
+    usage_explanation_request,
+)
 from schemas.chat import (
     CorrectionInfo,
     HistoryMessage,
     HistoryResponse,
+    SummaryBatchResponse,
     SummaryRequest,
     SummaryResponse,
     WordSuggestion,
 )
-from utils import strip_markdown_code_blocks
+from utils import content_text, strip_markdown_code_blocks
 
 # Configure logger for chat endpoints
 logger = logging.getLogger(__name__)
@@ -35,6 +55,330 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(tags=["chat"])
 
+# Max number of (thread_id, checkpoint_id) history responses kept in memory
+HISTORY_CACHE_SIZE = 512
+
+# thread_id -> WebSocket receiving that thread's TTS audio as binary frames.
+# Per process: with several workers, /chat only finds sockets on its own one
+_audio_sockets: dict[str, WebSocket] = {}
+
+# Close code for refused audio sockets (policy violation)
+WS_POLICY_VIOLATION = 1008
+
+# LRU cache of assembled history responses
+_history_cache: OrderedDict[tuple[str, str], HistoryResponse] = OrderedDict()
+
+# Max number of generated summary tips kept in memory, and their lifetime (s)
+TIPS_CACHE_SIZE = 1024
+TIPS_CACHE_TTL = 3600.0
+
+# LRU cache of prompt hash -> (created_at, tips)
+_tips_cache: OrderedDict[str, tuple[float, str]] = OrderedDict()
+
+# Summary tips model settings (shared by the interactive and batch paths)
+SUMMARY_MODEL = "claude-sonnet-4-5-20250929"
+SUMMARY_TEMPERATURE = 0.5
+SUMMARY_MAX_TOKENS = 1024
+
+# batch_id -> tips cache key for submitted Message Batches (bounded, oldest evicted)
+TIPS_BATCH_LIMIT = 1024
+_tips_batches: OrderedDict[str, str] = OrderedDict()
+
+# batch_id -> vocabulary matches whose usage explanations the batch generates
+_ielts_batches: OrderedDict[str, list[dict]] = OrderedDict()
+
+# custom_id of the usage explanation request in a summary batch (the tips
+# request uses its tips cache key)
+IELTS_BATCH_CUSTOM_ID = "ielts"
+
+# Tips shown when Claude's response can't be parsed
+TIPS_FALLBACK = "Keep practicing! You're making great progress in your English conversation skills."
+
+# SSE write coalescing: flush when this many bytes are pending...
+SSE_COALESCE_MAX_BYTES = 8192
+# ...or when no new frame arrives within this many seconds
+SSE_COALESCE_TIMEOUT = 0.01
+# Seconds of silence before an SSE keep-alive comment is sent
+SSE_KEEPALIVE_INTERVAL = 15.0
+# Max frames buffered between the generator and the HTTP writer
+SSE_QUEUE_SIZE = 64
+
+# Response headers for SSE streams
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "Connection": "keep-alive",
+    "X-Accel-Buffering": "no"  # Disable buffering for nginx
+}
+
+# Pre-encoded SSE frame parts so frames are built as bytes without re-encoding
+_SSE_PREFIXES: dict[str, bytes] = {
+    event: f"event: {event}\ndata: ".encode()
+    for event in (
+        "transcription",
+        "thread_id",
+        "chat_delta",
+        "chat_response",
+        "correction",
+        "audio_format",
+        "audio_chunk",
+        "error",
+        "complete",
+        "corrections",
+        "tips_delta",
+        "tips",
+        "ielts_suggestion",
+        "ielts_suggestions",
+    )
+}
+_SSE_SEPARATOR = b"\n\n"
+_SSE_PING = b": ping\n\n"
+
+# Sentinel marking the end of a coalesced SSE stream
+_SSE_STREAM_END = object()
+
+# Exception type name fragment -> user-friendly message, first match wins
+# ("ConnectionError" also covers APIConnectionError)
+_ERROR_MESSAGES: tuple[tuple[str, str], ...] = (
+    ("ConnectionError", "Unable to connect to the AI service. Please try again in a moment."),
+    ("RateLimitError", "The service is busy right now. Please wait a moment and try again."),
+    ("AuthenticationError", "There's a configuration issue with the AI service. Please contact support."),
+    ("Timeout", "The request took too long. Please try again."),
+)
+DEFAULT_ERROR_MESSAGE = "Something went wrong. Please try again."
+
+# Optimized summary tips prompt (~40% fewer tokens)
+SUMMARY_SYSTEM_PROMPT = """Analyze spoken English grammar patterns and give encouraging feedback.
+
+From the corrections, identify:
+1. Common patterns needing practice (with frequency count)
+2. 2-3 actionable speaking tips
+
+Focus on spoken clarity issues (tenses, agreement, articles). Ignore punctuation/capitalization.
+
+Output format (JSON):
+{
+  "tips": "2-3 paragraphs: (1) Celebrate effort (2) Key pattern + simple tip (3) Encouragement"
+}
+
+Example tips: "Great conversation! 🎉 You're expressing yourself well.\n\nI noticed past/present tense mix-ups ('I go' vs 'I went'). Try narrating your day in past tense!\n\nKeep speaking - you're doing amazing! 🌟"
+
+Be warm and specific!"""
+
+# Plain system message: at ~200 tokens the prompt is below Anthropic's
+# minimum cacheable prefix, so a cache breakpoint would never take effect
+SUMMARY_SYSTEM_MESSAGE = SystemMessage(content=SUMMARY_SYSTEM_PROMPT)
+
+# Static parts of the tips request; the corrections summary goes between them
+TIPS_REQUEST_HEAD = "Please analyze these grammar corrections from a conversation:\n\n"
+TIPS_REQUEST_TAIL = "\n\nTotal corrections: %d\n\nIdentify patterns and provide personalized tips."
+
+# Max distinct corrections sent to Claude for tips (bounds prompt size)
+SUMMARY_MAX_CORRECTIONS = 20
+
+
+def _sample_corrections(corrections: list[dict]) -> list[dict]:
+    """
+    Pick the most recent corrections with distinct issue sets.
+
+    Args:
+        corrections: All corrections with issues, oldest first
+
+    Returns:
+        Up to SUMMARY_MAX_CORRECTIONS corrections, oldest first
+    """
+    seen_issues: set[tuple[str, ...]] = set()
+    sample: list[dict] = []
+    for c in reversed(corrections):
+        signature = tuple(c.get("issues", []))
+        if signature in seen_issues:
+            continue
+        seen_issues.add(signature)
+        sample.append(c)
+        if len(sample) >= SUMMARY_MAX_CORRECTIONS:
+            break
+    sample.reverse()
+    return sample
+
+
+def _thread_config(thread_id: str) -> RunnableConfig:
+    """Build the LangGraph config that selects a conversation thread."""
+    return {"configurable": {"thread_id": thread_id}}
+
+
+def _sse(event: str, data) -> bytes:
+    """
+    Format a Server-Sent Event frame.
+
+    Payloads are JSON-encoded, except bytes which are sent as-is (used for
+    audio_chunk, whose base64 payload is already SSE-safe).
+    """
+    payload = data if isinstance(data, bytes) else orjson.dumps(data)
+    return _SSE_PREFIXES[event] + payload + _SSE_SEPARATOR
+
+
+async def _coalesce_sse(frames: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """
+    Merge bursts of SSE frames into fewer HTTP writes.
+
+    Frames are buffered until SSE_COALESCE_MAX_BYTES are pending or
+    SSE_COALESCE_TIMEOUT seconds have passed since the first buffered frame.
+    Frames are only ever concatenated whole, so event boundaries are
+    preserved. A comment ping is sent after SSE_KEEPALIVE_INTERVAL seconds
+    of silence.
+    """
+    queue: asyncio.Queue = asyncio.Queue(maxsize=SSE_QUEUE_SIZE)
+    loop = asyncio.get_running_loop()
+
+    async def pump() -> None:
+        try:
+            async for frame in frames:
+                await queue.put(frame)
+        except Exception as e:
+            await queue.put(e)
+            return
+        await queue.put(_SSE_STREAM_END)
+
+    producer = asyncio.create_task(pump())
+    try:
+        finished = False
+        while not finished:
+            try:
+                item = await asyncio.wait_for(
+                    queue.get(), timeout=SSE_KEEPALIVE_INTERVAL)
+            except asyncio.TimeoutError:
+                # Keep proxies from dropping the connection during slow nodes
+                yield _SSE_PING
+                continue
+            if item is _SSE_STREAM_END:
+                break
+            if isinstance(item, Exception):
+                raise item
+
+            # The window opens with the first buffered frame and is not
+            # extended by later ones, so latency stays bounded on busy streams
+            pending = [item]
+            pending_size = len(item)
+            error = None
+            deadline = loop.time() + SSE_COALESCE_TIMEOUT
+            while pending_size < SSE_COALESCE_MAX_BYTES:
+                try:
+                    item = await asyncio.wait_for(
+                        queue.get(), timeout=max(0.0, deadline - loop.time()))
+                except asyncio.TimeoutError:
+                    break
+                if item is _SSE_STREAM_END:
+                    finished = True
+                    break
+                if isinstance(item, Exception):
+                    error = item
+                    break
+                pending.append(item)
+                pending_size += len(item)
+
+            # Flush what was already produced before surfacing a failure
+            yield b"".join(pending)
+            if error is not None:
+                raise error
+    finally:
+        producer.cancel()
+
+
+@lru_cache(maxsize=1)
+def _get_summary_llm() -> ChatAnthropic:
+    """Get the Claude client used for summary tips (created once, reused)."""
+    return ChatAnthropic(
+        model=SUMMARY_MODEL,  # type: ignore
+        temperature=SUMMARY_TEMPERATURE,
+        max_tokens=SUMMARY_MAX_TOKENS,
+    )
+
+
+@lru_cache(maxsize=1)
+def _get_anthropic_client() -> AsyncAnthropic:
+    """Get the raw Anthropic client used for Message Batches (created once, reused)."""
+    return AsyncAnthropic()
+
+
+def _guardrail_events(node_output: dict) -> Iterator[tuple[str, dict]]:
+    """Emit the rejection message as a chat_response if the guardrail rejected."""
+    # Check if guardrail rejected the message
+    if node_output.get("guardrail_passed", True):
+        return
+    # Extract rejection message and emit as chat_response
+    messages = node_output.get("messages", [])
+    if messages:
+        yield "chat_response", {
+            "content": messages[0].content,
+            "role": "assistant",
+            "rejected": True  # Flag to indicate this was a guardrail rejection
+        }
+
+
+def _tts_events(turn_audio: list[tuple[bytes, str]]) -> Iterator[tuple[str, dict | bytes]]:
+    """
+    Emit TTS audio (task 4.1, 4.2) handed to the turn's audio sink.
+
+    The format goes in an audio_format event; the audio_chunk data is the raw
+    audio bytes, which event_generator sends over the thread's audio
+    WebSocket or base64-encodes for SSE.
+    """
+    for tts_audio, tts_format in turn_audio:
+        yield "audio_format", {"format": tts_format or "opus"}
+        yield "audio_chunk", tts_audio
+    turn_audio.clear()
+
+
+async def _send_audio_binary(thread_id: str, audio: bytes) -> bool:
+    """
+    Send TTS audio over the thread's audio WebSocket, if one is connected.
+
+    Returns:
+        True if the audio was sent, False if the caller should fall back to SSE
+    """
+    websocket = _audio_sockets.get(thread_id)
+    if websocket is None:
+        return False
+    try:
+        await websocket.send_bytes(audio)
+        return True
+    except Exception as e:
+        logger.warning(f"Audio WebSocket send failed, falling back to SSE: {e}")
+        return False
+
+
+def _chat_tts_events(node_output: dict) -> Iterator[tuple[str, dict]]:
+    """Emit the AI message as chat_response (its TTS audio follows separately)."""
+    messages = node_output.get("messages", [])
+    if messages:
+        yield "chat_response", {
+            "content": messages[0].content,
+            "role": "assistant"
+        }
+
+
+def _correction_events(node_output: dict) -> Iterator[tuple[str, dict]]:
+    """Emit the correction just added by the correction node."""
+    corrections = node_output.get("corrections", [])
+    if corrections:
+        yield "correction", corrections[-1]
+
+
+def _no_events(node_output: dict) -> Iterator[tuple[str, dict]]:
+    """Emit nothing from the update (the node's output goes out of band)."""
+    return iter(())
+
+
+# Graph node name -> handler turning its update into (event, data) pairs
+_NODE_EVENT_HANDLERS: dict[str, Callable[[dict], Iterator[tuple[str, dict]]]] = {
+    "guardrail": _guardrail_events,
+    "chat_tts": _chat_tts_events,
+    "correction": _correction_events,
+    "tts": _no_events,
+}
+
+# Nodes that synthesize speech; their audio is emitted after their update
+_TTS_NODES = frozenset({"chat_tts", "tts"})
+
 
 @router.post("/chat")
 async def chat(
@@ -54,39 +398,40 @@ async def chat(
     - error event (if node fails)
     """
     # Generate thread_id for new conversations
-    thread_id = thread_id or str(uuid.uuid4())
+    thread_id = thread_id or secrets.token_hex(16)
 
-    # Read audio file bytes
+    # Read audio file bytes now: FastAPI closes form uploads when this handler
+    # returns, before the streaming generator runs, so audio.file can't be
+    # handed to Whisper directly
     audio_bytes = await audio.read()
 
-    # Initialize OpenAI client for Whisper API
-    openai_client = OpenAI()
-
     # Variable to hold transcribed text
     transcribed_text = ""
 
-    # Configuration for thread persistence
-    config = {
-        "configurable": {
-            "thread_id": thread_id
-        }
-    }
+    # Configuration for thread persistence. TTS audio is handed to the
+    # audio_sink instead of graph state so it is never checkpointed
+    turn_audio: list[tuple[bytes, str]] = []
+    config = _thread_config(thread_id)
+    config["configurable"]["audio_sink"] = (
+        lambda audio, audio_format: turn_audio.append((audio, audio_format)))
 
-    async def event_generator():
+    async def event_generator() -> AsyncIterator[bytes]:
         """Generate SSE events from graph stream"""
         nonlocal transcribed_text
         try:
-            # Step 1: Transcribe audio using Whisper API
+            # Step 1: Send thread_id (for new conversations) right away so the
+            # client has it while transcription is still running
+            yield _sse("thread_id", {"thread_id": thread_id})
+
+            # Step 2: Transcribe audio using Whisper API
             try:
-                # Create a file-like object from audio bytes
-                import io
-                audio_file = io.BytesIO(audio_bytes)
-                # Use the original filename (with extension) from the upload
-                # This tells Whisper API the correct format (webm, mp4, wav, etc.)
-                audio_file.name = audio.filename or "audio.webm"
-
-                # Call Whisper API
-                transcript = openai_client.audio.transcriptions.create(
+                # Pass (filename, bytes) straight to the SDK - no BytesIO copy.
+                # The original filename (with extension) from the upload
+                # tells Whisper API the correct format (webm, mp4, wav, etc.)
+                audio_file = (audio.filename or "audio.webm", audio_bytes)
+
+                # Call Whisper API (async client, doesn't block the event loop)
+                transcript = await get_openai_client().audio.transcriptions.create(
                     model="whisper-1",
                     file=audio_file,
                     language="en"
@@ -94,13 +439,12 @@ async def chat(
 
                 transcribed_text = transcript.text
 
-                # Emit transcription event immediately (before thread_id)
-                import time
+                # Emit transcription event immediately
                 transcription_data = {
                     "text": transcribed_text,
                     "timestamp": int(time.time())
                 }
-                yield f"event: transcription\ndata: {json.dumps(transcription_data)}\n\n"
+                yield _sse("transcription", transcription_data)
 
             except Exception as whisper_error:
                 # Log Whisper API error
@@ -120,12 +464,9 @@ async def chat(
                     "message": f"Speech recognition failed: {str(whisper_error)}",
                     "code": "STT_FAILED"
                 }
-                yield f"event: error\ndata: {json.dumps(error_data)}\n\n"
+                yield _sse("error", error_data)
                 return  # Stop processing if transcription fails
 
-            # Step 2: Send thread_id (for new conversations)
-            yield f"event: thread_id\ndata: {json.dumps({'thread_id': thread_id})}\n\n"
-
             # Step 3: Create Graph input using transcribed text
             input_state = {
                 "messages": [HumanMessage(content=transcribed_text)],
@@ -135,71 +476,41 @@ async def chat(
             chat_succeeded = False
             correction_succeeded = False
 
-            async for update in graph.astream(input_state, config, stream_mode="updates"):
+            # "messages" mode yields Claude tokens as they are generated, so the
+            # reply renders before chat_tts finishes; "updates" yields node outputs
+            async for mode, update in graph.astream(
+                input_state, config, stream_mode=["updates", "messages"]
+            ):
+                if mode == "messages":
+                    message_chunk, metadata = update
+                    # Only the conversational reply is streamed; guardrail and
+                    # correction tokens are JSON and arrive via their updates
+                    if metadata.get("langgraph_node") == "chat_tts":
+                        delta = content_text(message_chunk.content)
+                        if delta:
+                            yield _sse("chat_delta", {"content": delta})
+                    continue
+
                 # Each update is a dict with node name as key
                 for node_name, node_output in update.items():
                     logger.info(f'Processing node: {node_name}')
+                    handler = _NODE_EVENT_HANDLERS.get(node_name)
+                    if handler is None:
+                        continue
+                    events = handler(node_output or {})
+                    if node_name in _TTS_NODES:
+                        events = itertools.chain(events, _tts_events(turn_audio))
                     try:
-                        if node_name == "guardrail":
-                            # Check if guardrail rejected the message
-                            guardrail_passed = node_output.get(
-                                "guardrail_passed", True)
-                            if not guardrail_passed:
-                                # Extract rejection message and emit as chat_response
-                                messages = node_output.get("messages", [])
-                                if messages:
-                                    rejection_message = messages[0]
-                                    chat_data = {
-                                        "content": rejection_message.content,
-                                        "role": "assistant",
-                                        "rejected": True  # Flag to indicate this was a guardrail rejection
-                                    }
-                                    yield f"event: chat_response\ndata: {json.dumps(chat_data)}\n\n"
-                                    chat_succeeded = True
-
-                        elif node_name == "chat_tts":
-                            # Combined chat + TTS node output
-                            # Extract the AI message
-                            messages = node_output.get("messages", [])
-                            if messages:
-                                ai_message = messages[0]
-                                chat_data = {
-                                    "content": ai_message.content,
-                                    "role": "assistant"
-                                }
-                                yield f"event: chat_response\ndata: {json.dumps(chat_data)}\n\n"
+                        for event, data in events:
+                            if event == "audio_chunk":
+                                if await _send_audio_binary(thread_id, data):
+                                    continue
+                                data = base64.b64encode(data)
+                            yield _sse(event, data)
+                            if event == "chat_response":
                                 chat_succeeded = True
-
-                            # Extract and stream audio data
-                            tts_audio = node_output.get("tts_audio")
-                            tts_format = node_output.get("tts_format")
-                            if tts_audio:
-                                audio_data = {
-                                    "audio": tts_audio,
-                                    "format": tts_format or "opus"
-                                }
-                                yield f"event: audio_chunk\ndata: {json.dumps(audio_data)}\n\n"
-
-                        elif node_name == "correction":
-                            # Extract the correction data
-                            corrections = node_output.get("corrections", [])
-                            if corrections:
-                                # Get the last correction (the one just added)
-                                correction = corrections[-1]
-                                yield f"event: correction\ndata: {json.dumps(correction)}\n\n"
+                            elif event == "correction":
                                 correction_succeeded = True
-
-                        elif node_name == "tts":
-                            # Extract and stream audio data (task 4.1, 4.2)
-                            tts_audio = node_output.get("tts_audio")
-                            tts_format = node_output.get("tts_format")
-                            if tts_audio:
-                                audio_data = {
-                                    "audio": tts_audio,
-                                    "format": tts_format or "opus"
-                                }
-                                yield f"event: audio_chunk\ndata: {json.dumps(audio_data)}\n\n"
-
                     except Exception as node_error:
                         # Log node-specific error
                         logger.error(
@@ -218,7 +529,7 @@ async def chat(
                             "node": node_name,
                             "message": f"Unable to get {node_name} response. The conversation can continue."
                         }
-                        yield f"event: error\ndata: {json.dumps(error_data)}\n\n"
+                        yield _sse("error", error_data)
 
             # Send completion event with status
             completion_data = {
@@ -226,7 +537,7 @@ async def chat(
                 "chat_succeeded": chat_succeeded,
                 "correction_succeeded": correction_succeeded
             }
-            yield f"event: complete\ndata: {json.dumps(completion_data)}\n\n"
+            yield _sse("complete", completion_data)
 
         except Exception as e:
             # Log the error with full context
@@ -244,16 +555,11 @@ async def chat(
 
             # Determine user-friendly error message
             error_type = type(e).__name__
-            if "APIConnectionError" in error_type or "ConnectionError" in error_type:
-                user_message = "Unable to connect to the AI service. Please try again in a moment."
-            elif "RateLimitError" in error_type:
-                user_message = "The service is busy right now. Please wait a moment and try again."
-            elif "AuthenticationError" in error_type:
-                user_message = "There's a configuration issue with the AI service. Please contact support."
-            elif "Timeout" in error_type:
-                user_message = "The request took too long. Please try again."
-            else:
-                user_message = "Something went wrong. Please try again."
+            user_message = next(
+                (message for fragment, message in _ERROR_MESSAGES
+                 if fragment in error_type),
+                DEFAULT_ERROR_MESSAGE,
+            )
 
             # Send error event with user-friendly message
             error_data = {
@@ -261,19 +567,123 @@ async def chat(
                 "message": user_message,
                 "error_type": error_type
             }
-            yield f"event: error\ndata: {json.dumps(error_data)}\n\n"
+            yield _sse("error", error_data)
 
     return StreamingResponse(
-        event_generator(),
+        _coalesce_sse(event_generator()),
         media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-            "X-Accel-Buffering": "no"  # Disable buffering for nginx
-        }
+        headers=SSE_HEADERS
     )
 
 
+# Message class -> (frontend role, id suffix) for history responses
+_HISTORY_ROLES: dict[type, tuple[str, str]] = {
+    HumanMessage: ("user", "human"),
+    AIMessage: ("assistant", "ai"),
+}
+
+
+def _correction_index(message_id: str) -> int | None:
+    """Parse N from a correction message_id of the form "msg_N"."""
+    if not message_id.startswith("msg_"):
+        return None
+    try:
+        return int(message_id.split("_")[1])
+    except (ValueError, IndexError):
+        return None
+
+
+def _build_history(messages: list, corrections: list[dict]) -> HistoryResponse:
+    """
+    Transform graph state messages and corrections into a HistoryResponse.
+
+    Args:
+        messages: LangChain messages from the thread state
+        corrections: Correction dicts from the thread state
+
+    Returns:
+        HistoryResponse in frontend format
+    """
+    # Build a map of corrections by message index
+    # Corrections have message_id like "msg_N" where N is the message index
+    correction_map: dict[int, dict] = {
+        idx: correction
+        for correction in corrections
+        if (idx := _correction_index(correction.get("message_id", ""))) is not None
+    }
+
+    # Transform messages to frontend format
+    result_messages: list[HistoryMessage] = []
+    append = result_messages.append
+
+    for i, msg in enumerate(messages):
+        roles = _HISTORY_ROLES.get(type(msg))
+        if roles is None:
+            continue
+        role, msg_type = roles
+
+        correction = None
+        if role == "user":
+            # Find correction for this user message
+            # Correction message_id uses 1-based index counting only user+assistant pairs
+            correction_data = correction_map.get(i + 1)
+            if correction_data:
+                correction = CorrectionInfo(
+                    original=correction_data.get("original", ""),
+                    corrected=correction_data.get("corrected", ""),
+                    issues=correction_data.get("issues", []),
+                    explanation=correction_data.get("explanation", "")
+                )
+
+        append(HistoryMessage(
+            id=f"msg_{i}_{msg_type}",
+            role=role,
+            content=content_text(msg.content),
+            timestamp=0,  # LangGraph doesn't store timestamps
+            correction=correction
+        ))
+
+    return HistoryResponse(messages=result_messages)
+
+
+@router.websocket("/chat/ws/{thread_id}")
+async def chat_audio_socket(websocket: WebSocket, thread_id: str):
+    """
+    Receive TTS audio for a thread as binary WebSocket frames.
+
+    While connected, /chat sends this thread's audio here as raw bytes
+    instead of base64 audio_chunk SSE events, saving the base64 encode and
+    ~33% of the audio bandwidth. Text events still go over SSE.
+
+    WebSockets bypass the CORS middleware, so the Origin is checked against
+    ALLOWED_ORIGINS here. Only one socket per thread: a second connection is
+    refused instead of taking over the connected client's audio.
+    """
+    origin = websocket.headers.get("origin", "").rstrip("/")
+    if origin not in get_allowed_origins():
+        logger.warning(f"Audio WebSocket refused for origin {origin!r}")
+        await websocket.close(code=WS_POLICY_VIOLATION)
+        return
+
+    if thread_id in _audio_sockets:
+        logger.warning(f"Audio WebSocket refused: thread {thread_id} already connected")
+        await websocket.close(code=WS_POLICY_VIOLATION)
+        return
+
+    # Claim the thread before awaiting, so concurrent connects can't both pass
+    _audio_sockets[thread_id] = websocket
+    try:
+        await websocket.accept()
+        # Nothing is expected from the client; wait until it disconnects
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                break
+    finally:
+        if _audio_sockets.get(thread_id) is websocket:
+            del _audio_sockets[thread_id]
+
+
 @router.get("/history/{thread_id}", response_model=HistoryResponse)
 async def get_history(
     thread_id: str,
@@ -282,236 +692,612 @@ async def get_history(
     """
     Retrieve conversation history for a thread.
 
-    Used to restore conversation state on page refresh.
+    Used to restore conversation state on page refresh. Responses are
+    memoized per (thread_id, checkpoint_id), so repeat refreshes of an
+    unchanged thread skip the rebuild.
     """
-    config: RunnableConfig = {"configurable": {"thread_id": thread_id}}
+    config = _thread_config(thread_id)
 
     try:
-        state = graph.get_state(config)
+        state = await graph.aget_state(config)
 
         if state is None or state.values is None:
             return HistoryResponse(messages=[])
 
-        messages = state.values.get("messages", [])
-        corrections = state.values.get("corrections", [])
+        checkpoint_id = (state.config or {}).get(
+            "configurable", {}).get("checkpoint_id")
+        cache_key = (thread_id, checkpoint_id)
+        if checkpoint_id is not None and cache_key in _history_cache:
+            _history_cache.move_to_end(cache_key)
+            return _history_cache[cache_key]
 
-        # Build a map of corrections by message index
-        # Corrections have message_id like "msg_N" where N is the message index
-        correction_map: dict[int, dict] = {}
-        for correction in corrections:
-            msg_id = correction.get("message_id", "")
-            if msg_id.startswith("msg_"):
-                try:
-                    idx = int(msg_id.split("_")[1])
-                    correction_map[idx] = correction
-                except (ValueError, IndexError):
-                    pass
-
-        # Transform messages to frontend format
-        result_messages: list[HistoryMessage] = []
-        user_msg_count = 0
-
-        for i, msg in enumerate(messages):
-            msg_type = getattr(msg, "type", None)
-            if msg_type == "human":
-                role = "user"
-                user_msg_count += 1
-                # Find correction for this user message
-                # Correction message_id uses 1-based index counting only user+assistant pairs
-                correction_data = correction_map.get(i + 1)
-                correction = None
-                if correction_data:
-                    correction = CorrectionInfo(
-                        original=correction_data.get("original", ""),
-                        corrected=correction_data.get("corrected", ""),
-                        issues=correction_data.get("issues", []),
-                        explanation=correction_data.get("explanation", "")
-                    )
-            elif msg_type == "ai":
-                role = "assistant"
-                correction = None
-            else:
-                continue
+        history = _build_history(
+            state.values.get("messages", []),
+            state.values.get("corrections", []),
+        )
 
-            result_messages.append(HistoryMessage(
-                id=f"msg_{i}_{msg_type}",
-                role=role,
-                content=str(msg.content),
-                timestamp=0,  # LangGraph doesn't store timestamps
-                correction=correction
-            ))
+        if checkpoint_id is not None:
+            _history_cache[cache_key] = history
+            if len(_history_cache) > HISTORY_CACHE_SIZE:
+                _history_cache.popitem(last=False)
 
-        return HistoryResponse(messages=result_messages)
+        return history
 
     except Exception as e:
         # Return empty history on error
         return HistoryResponse(messages=[])
 
 
-@router.post("/summary", response_model=SummaryResponse)
-async def get_summary(
-    request: SummaryRequest,
-    graph: Annotated[CompiledStateGraph, Depends(get_graph)],
-    ielts_index: Annotated[FAISS | None, Depends(get_ielts_index)]
-):
+async def _load_summary_corrections(
+    graph: CompiledStateGraph,
+    thread_id: str,
+) -> tuple[list[dict], str | None]:
     """
-    Generate a practice summary for a conversation thread.
+    Read the corrections with issues for a thread from the checkpointer.
 
-    Parts:
-    1. List all grammar corrections from thread state (no AI call)
-    2. AI-generated tips based on correction analysis
-    3. IELTS vocabulary suggestions based on corrected sentences (in parallel with tips)
+    Args:
+        graph: Compiled graph holding the thread state
+        thread_id: Thread to summarize
 
-    # to user's learning journal in Notion for long-term progress tracking.
+    Returns:
+        Tuple of (corrections, canned tips). Canned tips are set when there is
+        nothing for the AI to analyze, otherwise None.
+    """
+    config = _thread_config(thread_id)
+    state = await graph.aget_state(config)
+
+    if state is None or state.values is None:
+        return [], "Start a conversation to get grammar feedback and personalized tips!"
+
+    corrections = state.values.get("corrections", [])
+    # Filter out corrections without issues
+    corrections = [c for c in corrections if c.get("issues")]
+
+    # Handle empty corrections (skip RAG pipeline)
+    if not corrections:
+        return [], "Excellent! You haven't made any grammar errors in this conversation. Keep up the great work! 🎉"
+
+    return corrections, None
+
+
+def _tips_messages(corrections: list[dict]) -> list:
+    """Build the Claude messages asking for tips on these corrections."""
+    # Build the request in one buffer: corrections summary (bounded sample,
+    # true total below) between the static head and tail. Issues are joined
+    # as plain text rather than a list repr: fewer prompt tokens.
+    buf: list[str] = [TIPS_REQUEST_HEAD]
+    append = buf.append
+    for i, c in enumerate(_sample_corrections(corrections)):
+        if i:
+            append("\n")
+        append("- Original: \"")
+        append(c["original"])
+        append("\"\n  Corrected: \"")
+        append(c["corrected"])
+        append("\"\n  Issues: ")
+        append(", ".join(c["issues"]))
+    append(TIPS_REQUEST_TAIL % len(corrections))
+    analysis_request = "".join(buf)
+
+    return [
+        SUMMARY_SYSTEM_MESSAGE,
+        HumanMessage(content=analysis_request)
+    ]
+
+
+def _tips_cache_key(messages: list) -> str:
+    """Hash the analysis request; same corrections -> same prompt -> same key."""
+    return hashlib.blake2b(
+        messages[-1].content.encode(), digest_size=16).hexdigest()
+
+
+def _get_cached_tips(cache_key: str) -> str | None:
+    """Return recently generated tips for this prompt, if any."""
+    cached = _tips_cache.get(cache_key)
+    if cached is None or time.monotonic() - cached[0] >= TIPS_CACHE_TTL:
+        return None
+    _tips_cache.move_to_end(cache_key)
+    return cached[1]
+
+
+def _store_tips(cache_key: str, tips: str) -> None:
+    """Remember generated tips for this prompt."""
+    _tips_cache[cache_key] = (time.monotonic(), tips)
+    if len(_tips_cache) > TIPS_CACHE_SIZE:
+        _tips_cache.popitem(last=False)
+
+
+def _parse_tips(content: str) -> str | None:
+    """
+    Extract tips from Claude's JSON response.
+
+    Returns:
+        Tips text, or None if the response can't be parsed
+    """
+    try:
+        # Fast path: bare JSON. Otherwise strip markdown code blocks
+        # (Claude sometimes wraps JSON) and retry.
+        try:
+            analysis = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            analysis = orjson.loads(strip_markdown_code_blocks(content))
+
+        return analysis.get(
+            "tips", "Keep practicing! Every conversation helps you improve.")
+
+    except (orjson.JSONDecodeError, KeyError):
+        return None
+
+
+async def _generate_tips(corrections: list[dict]) -> str:
+    """
+    Generate personalized practice tips from corrections using Claude Sonnet.
 
     Args:
-        request: SummaryRequest with thread_id
+        corrections: Corrections with issues, oldest first
 
     Returns:
-        SummaryResponse with corrections, tips, common patterns, and ielts_suggestions
+        Tips text (a friendly fallback if the AI response can't be parsed)
     """
-    thread_id = request.thread_id
+    messages = _tips_messages(corrections)
 
-    # Part 1: Query thread state for corrections (no AI needed)
-    config: RunnableConfig = {"configurable": {"thread_id": thread_id}}
+    # Same corrections -> same prompt: reuse recent tips instead of calling Claude
+    cache_key = _tips_cache_key(messages)
+    cached = _get_cached_tips(cache_key)
+    if cached is not None:
+        return cached
 
-    try:
-        # Get state from the graph's checkpointer
-        state = graph.get_state(config)
+    tips_response = await _get_summary_llm().ainvoke(messages)
 
-        if state is None or state.values is None:
-            return SummaryResponse(
-                corrections=[],
-                tips="Start a conversation to get grammar feedback and personalized tips!",
-                ielts_suggestions=[]
-            )
+    tips = _parse_tips(content_text(tips_response.content))
+    if tips is None:
+        # Fallback if AI response can't be parsed
+        return TIPS_FALLBACK
 
-        corrections = state.values.get("corrections", [])
-        # Filter out corrections without issues
-        corrections = [c for c in corrections if c.get("issues")]
+    _store_tips(cache_key, tips)
+    return tips
 
-        # Handle empty corrections (skip RAG pipeline)
-        if not corrections:
-            return SummaryResponse(
-                corrections=[],
-                tips="Excellent! You haven't made any grammar errors in this conversation. Keep up the great work! 🎉",
-                ielts_suggestions=[]
-            )
 
-        # Part 2 & 3: Run tips generation and IELTS RAG pipeline in parallel
-        llm = ChatAnthropic(
-            model="claude-sonnet-4-5-20250929",  # type: ignore
-            temperature=0.5,
+async def _stream_tips(corrections: list[dict]) -> AsyncIterator[tuple[str, str]]:
+    """
+    Stream practice tips from Claude Sonnet as they are generated.
+
+    Claude answers in JSON, so the partial response is re-parsed on each chunk
+    and only the newly completed part of the "tips" string is emitted.
+
+    Yields:
+        ("tips_delta", text) pairs while streaming, then ("tips", full_tips)
+    """
+    messages = _tips_messages(corrections)
+
+    cache_key = _tips_cache_key(messages)
+    cached = _get_cached_tips(cache_key)
+    if cached is not None:
+        yield "tips", cached
+        return
+
+    content = ""
+    sent_tips = ""
+    async for chunk in _get_summary_llm().astream(messages):
+        content += content_text(chunk.content)
+
+        partial = parse_partial_json(strip_markdown_code_blocks(content))
+        partial_tips = partial.get("tips") if isinstance(partial, dict) else None
+        if (
+            isinstance(partial_tips, str)
+            and len(partial_tips) > len(sent_tips)
+            and partial_tips.startswith(sent_tips)
+        ):
+            yield "tips_delta", partial_tips[len(sent_tips):]
+            sent_tips = partial_tips
+
+    tips = _parse_tips(content)
+    if tips is None:
+        yield "tips", TIPS_FALLBACK
+        return
+
+    _store_tips(cache_key, tips)
+    yield "tips", tips
+
+
+def _corrected_sentences(corrections: list[dict]) -> list[str]:
+    """Get the corrected sentences the IELTS pipeline works on."""
+    return [c.get("corrected", "") for c in corrections if c.get("corrected")]
+
+
+def _to_word_suggestions(suggestions: list[dict]) -> list[WordSuggestion]:
+    """Convert IELTS pipeline suggestions to Pydantic models."""
+    return [
+        WordSuggestion(
+            target_word=s.get("target_word", ""),
+            ielts_word=s.get("ielts_word", ""),
+            definition=s.get("definition", ""),
+            example=s.get("example", ""),
+            usage_context=s.get("usage_context", "")
         )
+        for s in suggestions
+    ]
+
 
-        # Prepare corrections summary for AI
-        corrections_text = "\n".join([
-            f"- Original: \"{c['original']}\"\n  Corrected: \"{c['corrected']}\"\n  Issues: {c['issues']}"
-            for c in corrections
-        ])
+async def _generate_ielts_suggestions(
+    corrections: list[dict],
+    ielts_index: FAISS | None,
+) -> list[WordSuggestion]:
+    """
+    Run the IELTS RAG pipeline (Task 6.4: graceful degradation).
 
-        # Optimized summary tips prompt (~40% fewer tokens)
-        system_prompt = """Analyze spoken English grammar patterns and give encouraging feedback.
+    Args:
+        corrections: Corrections with issues, oldest first
+        ielts_index: Loaded FAISS index, or None if unavailable
 
-From the corrections, identify:
-1. Common patterns needing practice (with frequency count)
-2. 2-3 actionable speaking tips
+    Returns:
+        IELTS vocabulary suggestions (empty if unavailable or on failure)
+    """
+    if ielts_index is None:
+        logger.debug("IELTS index not available, skipping suggestions")
+        return []
 
-Focus on spoken clarity issues (tenses, agreement, articles). Ignore punctuation/capitalization.
+    try:
+        corrected_sentences = _corrected_sentences(corrections)
+        if not corrected_sentences:
+            return []
 
-Output format (JSON):
-{
-  "tips": "2-3 paragraphs: (1) Celebrate effort (2) Key pattern + simple tip (3) Encouragement"
-}
+        ielts_result = await run_ielts_rag_pipeline(corrected_sentences, ielts_index)
+    except Exception as e:
+        # Task 6.4: Graceful degradation - return empty on failure
+        logger.warning(
+            f"IELTS RAG pipeline failed, returning empty suggestions: {e}")
+        return []
 
-Example tips: "Great conversation! 🎉 You're expressing yourself well.\n\nI noticed past/present tense mix-ups ('I go' vs 'I went'). Try narrating your day in past tense!\n\nKeep speaking - you're doing amazing! 🌟"
+    return _to_word_suggestions(ielts_result.get("suggestions", []))
 
-Be warm and specific!"""
 
-        analysis_request = f"""Please analyze these grammar corrections from a conversation:
+async def _stream_ielts_suggestions(
+    corrections: list[dict],
+    ielts_index: FAISS | None,
+) -> AsyncIterator[WordSuggestion]:
+    """
+    Stream the IELTS RAG pipeline (Task 6.4: graceful degradation).
+
+    Args:
+        corrections: Corrections with issues, oldest first
+        ielts_index: Loaded FAISS index, or None if unavailable
 
-{corrections_text}
+    Yields:
+        IELTS vocabulary suggestions as they are ready (stops on failure)
+    """
+    if ielts_index is None:
+        logger.debug("IELTS index not available, skipping suggestions")
+        return
 
-Total corrections: {len(corrections)}
+    corrected_sentences = _corrected_sentences(corrections)
+    if not corrected_sentences:
+        return
 
-Identify patterns and provide personalized tips."""
+    try:
+        async for suggestion in stream_ielts_rag_pipeline(
+                corrected_sentences, ielts_index):
+            yield _to_word_suggestions([suggestion])[0]
+    except Exception as e:
+        # Task 6.4: Graceful degradation - keep what was already sent
+        logger.warning(f"IELTS RAG pipeline failed, stopping suggestions: {e}")
 
-        messages = [
-            SystemMessage(content=system_prompt),
-            HumanMessage(content=analysis_request)
-        ]
 
-        # Task 6.2: Run tips and IELTS RAG in parallel
-        async def generate_tips():
-            """Generate tips using Claude Sonnet."""
-            response = await llm.ainvoke(messages)
-            return response
+async def _summary_event_generator(
+    graph: CompiledStateGraph,
+    thread_id: str,
+    ielts_index: FAISS | None,
+) -> AsyncIterator[bytes]:
+    """
+    Generate SSE events for a streamed summary.
 
-        async def generate_ielts_suggestions():
-            """Run IELTS RAG pipeline (Task 6.4: graceful degradation)."""
-            if ielts_index is None:
-                logger.debug("IELTS index not available, skipping suggestions")
-                return {"suggestions": []}
+    Corrections are sent as soon as the thread state is read. Tips stream in
+    as tips_delta events while the IELTS RAG pipeline runs in parallel; each
+    suggestion is sent as an ielts_suggestion event as soon as it is ready,
+    interleaved with the tips, followed by the full ielts_suggestions list.
+    """
+    tasks: list[asyncio.Task] = []
+    try:
+        corrections, canned_tips = await _load_summary_corrections(graph, thread_id)
+        yield _sse("corrections", {"corrections": corrections})
 
-            try:
-                # Extract corrected sentences from corrections
-                corrected_sentences = [c.get("corrected", "")
-                                       for c in corrections if c.get("corrected")]
-                if not corrected_sentences:
-                    return {"suggestions": []}
-
-                return await run_ielts_rag_pipeline(corrected_sentences, ielts_index)
-            except Exception as e:
-                # Task 6.4: Graceful degradation - return empty on failure
-                logger.warning(
-                    f"IELTS RAG pipeline failed, returning empty suggestions: {e}")
-                return {"suggestions": []}
-
-        # Run both tasks in parallel
-        tips_response, ielts_result = await asyncio.gather(
-            generate_tips(),
-            generate_ielts_suggestions()
+        if canned_tips is not None:
+            yield _sse("tips", {"tips": canned_tips})
+        else:
+            frames: asyncio.Queue[bytes | None] = asyncio.Queue()
+
+            async def produce_tips() -> None:
+                try:
+                    async for event, text in _stream_tips(corrections):
+                        key = "delta" if event == "tips_delta" else "tips"
+                        await frames.put(_sse(event, {key: text}))
+                finally:
+                    await frames.put(None)
+
+            async def produce_ielts() -> None:
+                try:
+                    suggestions: list[WordSuggestion] = []
+                    async for suggestion in _stream_ielts_suggestions(
+                            corrections, ielts_index):
+                        suggestions.append(suggestion)
+                        await frames.put(_sse("ielts_suggestion", {
+                            "suggestion": suggestion.model_dump()
+                        }))
+                    await frames.put(_sse("ielts_suggestions", {
+                        "ielts_suggestions": [s.model_dump() for s in suggestions]
+                    }))
+                finally:
+                    await frames.put(None)
+
+            tasks = [
+                asyncio.create_task(produce_tips()),
+                asyncio.create_task(produce_ielts()),
+            ]
+
+            # Each producer puts None when it finishes
+            running = len(tasks)
+            while running:
+                frame = await frames.get()
+                if frame is None:
+                    running -= 1
+                else:
+                    yield frame
+
+            # Surface producer failures
+            for task in tasks:
+                task.result()
+
+        yield _sse("complete", {"status": "done"})
+
+    except Exception as e:
+        logger.error(
+            "Summary stream error",
+            extra={
+                "thread_id": thread_id,
+                "error_type": type(e).__name__,
+                "error_message": str(e),
+            },
+            exc_info=True
         )
+        yield _sse("error", {"node": "summary", "message": f"Unable to generate summary: {str(e)}"})
 
-        # Parse tips AI response
-        try:
-            content = tips_response.content if isinstance(
-                tips_response.content, str) else str(tips_response.content)
+    finally:
+        for task in tasks:
+            task.cancel()
 
-            # Strip markdown code blocks if present (Claude sometimes wraps JSON)
-            content = strip_markdown_code_blocks(content)
 
-            analysis = json.loads(content)
+def _message_text(message) -> str:
+    """Get the concatenated text blocks of a raw Anthropic message."""
+    return "".join(
+        block.text for block in message.content if block.type == "text")
 
-            tips = analysis.get(
-                "tips", "Keep practicing! Every conversation helps you improve.")
 
-        except (json.JSONDecodeError, KeyError):
-            # Fallback if AI response can't be parsed
-            tips = "Keep practicing! You're making great progress in your English conversation skills."
+async def _batch_vocabulary_matches(
+    corrections: list[dict],
+    ielts_index: FAISS | None,
+) -> list[dict]:
+    """
+    Run the IELTS retrieval steps for a summary batch (empty on failure).
+
+    Args:
+        corrections: Corrections with issues, oldest first
+        ielts_index: Loaded FAISS index, or None if unavailable
+
+    Returns:
+        Vocabulary matches whose usage explanations go into the batch
+    """
+    corrected_sentences = _corrected_sentences(corrections)
+    if ielts_index is None or not corrected_sentences:
+        return []
+    try:
+        return await find_vocabulary_matches(corrected_sentences, ielts_index)
+    except Exception as e:
+        logger.warning(f"IELTS retrieval failed, batching tips only: {e}")
+        return []
+
+
+@router.post("/summary/batch", response_model=SummaryBatchResponse)
+async def submit_summary_batch(
+    request: SummaryRequest,
+    graph: Annotated[CompiledStateGraph, Depends(get_graph)],
+    ielts_index: Annotated[FAISS | None, Depends(get_ielts_index)],
+):
+    """
+    Queue summary tips and IELTS suggestions on the Anthropic Message Batches API.
+
+    For non-interactive clients (e.g. background journaling): batches are
+    billed at half the on-demand price but may take minutes to hours. Poll
+    GET /summary/batch/{batch_id} for the result. Vocabulary retrieval (local
+    keywords + FAISS) runs now; only the Claude calls are batched. Tips that
+    are already known (no corrections, or recently generated) are returned
+    without a batch, along with on-demand IELTS suggestions.
+
+    Args:
+        request: SummaryRequest with thread_id
+
+    Returns:
+        SummaryBatchResponse with batch_id and status, or the summary if already known
+    """
+    corrections, canned_tips = await _load_summary_corrections(
+        graph, request.thread_id)
+    if canned_tips is not None:
+        return SummaryBatchResponse(
+            status="ended", tips=canned_tips, ielts_suggestions=[])
+
+    messages = _tips_messages(corrections)
+    cache_key = _tips_cache_key(messages)
+    cached = _get_cached_tips(cache_key)
+    if cached is not None:
+        # Only the (single Haiku call) vocabulary step is left: run it now
+        return SummaryBatchResponse(
+            status="ended",
+            tips=cached,
+            ielts_suggestions=await _generate_ielts_suggestions(
+                corrections, ielts_index),
+        )
 
-        # Convert IELTS suggestions to Pydantic models
-        ielts_suggestions = [
-            WordSuggestion(
-                target_word=s.get("target_word", ""),
-                ielts_word=s.get("ielts_word", ""),
-                definition=s.get("definition", ""),
-                example=s.get("example", ""),
-                usage_context=s.get("usage_context", "")
+    batch_requests = [{
+        "custom_id": cache_key,
+        "params": {
+            "model": SUMMARY_MODEL,
+            "max_tokens": SUMMARY_MAX_TOKENS,
+            "temperature": SUMMARY_TEMPERATURE,
+            "system": SUMMARY_SYSTEM_PROMPT,
+            "messages": [{"role": "user", "content": messages[-1].content}],
+        },
+    }]
+
+    vocabulary_matches = await _batch_vocabulary_matches(corrections, ielts_index)
+    if vocabulary_matches:
+        batch_requests.append({
+            "custom_id": IELTS_BATCH_CUSTOM_ID,
+            "params": {
+                "model": USAGE_MODEL,
+                "max_tokens": USAGE_MAX_TOKENS,
+                "temperature": USAGE_TEMPERATURE,
+                "system": USAGE_SYSTEM_PROMPT,
+                "messages": [{
+                    "role": "user",
+                    "content": usage_explanation_request(
+                        vocabulary_matches, _corrected_sentences(corrections)),
+                }],
+            },
+        })
+
+    batch = await _get_anthropic_client().messages.batches.create(
+        requests=batch_requests)
+
+    _tips_batches[batch.id] = cache_key
+    if len(_tips_batches) > TIPS_BATCH_LIMIT:
+        _tips_batches.popitem(last=False)
+    if vocabulary_matches:
+        _ielts_batches[batch.id] = vocabulary_matches
+        if len(_ielts_batches) > TIPS_BATCH_LIMIT:
+            _ielts_batches.popitem(last=False)
+
+    return SummaryBatchResponse(batch_id=batch.id, status=batch.processing_status)
+
+
+@router.get("/summary/batch/{batch_id}", response_model=SummaryBatchResponse)
+async def get_summary_batch(batch_id: str):
+    """
+    Get the status of a batched summary, with its results once it has ended.
+
+    IELTS suggestions are empty if the batch had none, or if this process no
+    longer holds the batch's vocabulary matches (e.g. after a restart).
+
+    Args:
+        batch_id: Batch ID returned by POST /summary/batch
+
+    Returns:
+        SummaryBatchResponse with status, and tips + ielts_suggestions when
+        the batch has ended
+    """
+    client = _get_anthropic_client()
+    batch = await client.messages.batches.retrieve(batch_id)
+    if batch.processing_status != "ended":
+        return SummaryBatchResponse(batch_id=batch_id, status=batch.processing_status)
+
+    tips = TIPS_FALLBACK
+    ielts_suggestions: list[WordSuggestion] = []
+    vocabulary_matches = _ielts_batches.get(batch_id)
+    async for entry in await client.messages.batches.results(batch_id):
+        if entry.result.type != "succeeded":
+            logger.warning(
+                "Summary batch request did not succeed",
+                extra={"batch_id": batch_id, "result_type": entry.result.type}
             )
-            for s in ielts_result.get("suggestions", [])
-        ]
+            continue
+        text = _message_text(entry.result.message)
+        if entry.custom_id == IELTS_BATCH_CUSTOM_ID:
+            if vocabulary_matches:
+                ielts_suggestions = _to_word_suggestions(
+                    parse_usage_explanations(text, vocabulary_matches))
+            continue
+        parsed = _parse_tips(text)
+        if parsed is not None:
+            tips = parsed
+            # Later /summary calls for the same corrections reuse these tips
+            if _tips_batches.get(batch_id) == entry.custom_id:
+                _store_tips(entry.custom_id, tips)
+
+    return SummaryBatchResponse(
+        batch_id=batch_id,
+        status="ended",
+        tips=tips,
+        ielts_suggestions=ielts_suggestions,
+    )
 
-        return SummaryResponse(
-            corrections=corrections,
-            tips=tips,
-            ielts_suggestions=ielts_suggestions
+
+def _summary_json(
+    corrections: list[dict],
+    tips: str,
+    ielts_suggestions: list[WordSuggestion],
+) -> ORJSONResponse:
+    """
+    Serialize a SummaryResponse body straight to JSON.
+
+    The parts are already well-formed, so returning a Response skips
+    FastAPI's response_model validation and jsonable_encoder passes; the
+    response_model stays on the route for the OpenAPI schema.
+    """
+    return ORJSONResponse({
+        "corrections": corrections,
+        "tips": tips,
+        "ielts_suggestions": [s.model_dump() for s in ielts_suggestions],
+    })
+
+
+@router.post("/summary", response_model=SummaryResponse)
+async def get_summary(
+    request: SummaryRequest,
+    graph: Annotated[CompiledStateGraph, Depends(get_graph)],
+    ielts_index: Annotated[FAISS | None, Depends(get_ielts_index)],
+    accept: Annotated[str, Header()] = ""
+):
+    """
+    Generate a practice summary for a conversation thread.
+
+    Parts:
+    1. List all grammar corrections from thread state (no AI call)
+    2. AI-generated tips based on correction analysis
+    3. IELTS vocabulary suggestions based on corrected sentences (in parallel with tips)
+
+    # to user's learning journal in Notion for long-term progress tracking.
+
+    Clients sending `Accept: text/event-stream` get the parts as SSE events
+    (`corrections`, `tips`, `ielts_suggestions`, `complete`) so corrections
+    render before the AI calls finish. Other clients get a single JSON body.
+
+    Args:
+        request: SummaryRequest with thread_id
+
+    Returns:
+        SummaryResponse with corrections, tips, common patterns, and ielts_suggestions
+    """
+    thread_id = request.thread_id
+
+    if "text/event-stream" in accept:
+        return StreamingResponse(
+            _coalesce_sse(_summary_event_generator(graph, thread_id, ielts_index)),
+            media_type="text/event-stream",
+            headers=SSE_HEADERS
+        )
+
+    try:
+        # Part 1: Query thread state for corrections (no AI needed)
+        corrections, canned_tips = await _load_summary_corrections(graph, thread_id)
+        if canned_tips is not None:
+            return _summary_json([], canned_tips, [])
+
+        # Part 2 & 3: Run tips generation and IELTS RAG pipeline in parallel
+        tips, ielts_suggestions = await asyncio.gather(
+            _generate_tips(corrections),
+            _generate_ielts_suggestions(corrections, ielts_index)
         )
 
+        return _summary_json(corrections, tips, ielts_suggestions)
+
     except Exception as e:
         # Return error response
-        return SummaryResponse(
-            corrections=[],
-            tips=f"Unable to generate summary: {str(e)}",
-            ielts_suggestions=[]
-        )
+        return _summary_json([], f"Unable to generate summary: {str(e)}", [])
@@ -3,12 +3,26 @@ LangGraph workflow for Speak Chat App.
 Defines the graph state and nodes for parallel chat and grammar correction.
 """
 
+import importlib.util
 import logging
+import os
+import re
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from functools import lru_cache
 from typing import TypedDict, Annotated, Sequence
 
-logger = logging.getLogger(__name__)
-from langchain_core.messages import BaseMessage
+from langchain_anthropic import ChatAnthropic
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import BaseCheckpointSaver
+from langgraph.checkpoint.memory import MemorySaver
+from langgraph.graph import StateGraph, END
 from langgraph.graph.message import add_messages
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+
+logger = logging.getLogger(__name__)
 
 
 class Correction(TypedDict):
@@ -20,6 +34,20 @@ class Correction(TypedDict):
     message_id: str  # Reference to the user message being corrected
 
 
+class CorrectionAnalysis(TypedDict):
+    """Grammar analysis of one spoken message (Claude's structured output)."""
+    original: Annotated[str, ..., "The exact transcribed message"]
+    corrected: Annotated[str, ..., "Grammar-corrected version (keep original capitalization/punctuation)"]
+    issues: Annotated[list[str], ..., "Specific grammar errors, e.g. \"Past tense: 'go' → 'went'\""]
+    explanation: Annotated[str, ..., "A friendly 1-2 sentence explanation focused on the speaking error"]
+
+
+class GuardrailVerdict(TypedDict):
+    """Guardrail classification of one user message (Claude's structured output)."""
+    passed: Annotated[bool, ..., "True for conversational messages, false for task requests"]
+    response: Annotated[str | None, ..., "null if passed, or a friendly rejection message if not passed"]
+
+
 class GraphState(TypedDict):
     """
     State for the LangGraph workflow.
@@ -29,21 +57,143 @@ class GraphState(TypedDict):
                   Uses add_messages reducer to append new messages.
         corrections: List of grammar corrections for user messages.
         thread_id: Persistent conversation identifier for checkpointing.
-        tts_audio: Base64-encoded audio from TTS (transient, not persisted).
-        tts_format: Audio format (e.g., 'opus'). Transient, not persisted.
         guardrail_passed: Whether the user message passed the guardrail check.
     """
     messages: Annotated[Sequence[BaseMessage], add_messages]
     corrections: list[Correction]
     thread_id: str
-    tts_audio: str | None
-    tts_format: str | None
     guardrail_passed: bool | None
 
 
+@lru_cache(maxsize=8)
+def _get_llm(model: str, temperature: float) -> ChatAnthropic:
+    """
+    Get a shared Claude client for a (model, temperature) pair.
+
+    Created on first use (after .env is loaded) and reused across turns so
+    the underlying HTTP connection pool stays warm.
+    """
+    return ChatAnthropic(
+        model=model,  # type: ignore
+        temperature=temperature,
+    )
+
+
+@lru_cache(maxsize=1)
+def get_openai_client() -> AsyncOpenAI:
+    """
+    Get the shared OpenAI client (reads OPENAI_API_KEY from env).
+
+    Used for both TTS here and Whisper in /chat, so the two share one
+    keep-alive connection pool to the OpenAI API. Requests are multiplexed
+    over HTTP/2 when the h2 package is installed (pip install "httpx[http2]").
+    """
+    http2 = importlib.util.find_spec("h2") is not None
+    return AsyncOpenAI(http_client=DefaultAsyncHttpxClient(http2=http2))
+
+
+def _emit_audio(config: RunnableConfig, audio: bytes, audio_format: str) -> None:
+    """
+    Hand TTS audio to the caller's audio sink, if the run has one.
+
+    Callers set configurable["audio_sink"] to a callable taking
+    (audio_bytes, audio_format). Audio is passed this way instead of through
+    GraphState so it is never written to checkpoints.
+    """
+    sink = config.get("configurable", {}).get("audio_sink")
+    if sink is not None:
+        sink(audio, audio_format)
+
+
+@lru_cache(maxsize=8)
+def _system_message(prompt: str) -> BaseMessage:
+    """
+    Build a node's static system message once per prompt.
+
+    The message is shared by every call (it is never mutated). No prompt
+    cache breakpoint: these prompts are a few hundred tokens, below
+    Anthropic's minimum cacheable prefix, so one would never take effect.
+    """
+    return SystemMessage(content=prompt)
+
+
+def _history_window(messages: Sequence[BaseMessage]) -> list[BaseMessage]:
+    """
+    Get the recent history sent to chat_node, bounding input tokens per turn.
+
+    Keeps the last CHAT_HISTORY_WINDOW messages. The window starts at a user
+    message, as the Anthropic API requires.
+    """
+    window = list(messages[-CHAT_HISTORY_WINDOW:])
+    while window and getattr(window[0], "type", None) != "human":
+        window.pop(0)
+    return window
+
+
+def _last_message(messages: Sequence[BaseMessage], message_type: str) -> BaseMessage | None:
+    """
+    Get the most recent message of a type ("human", "ai"), or None.
+
+    Walks the history from the end, so the cost doesn't grow with the
+    conversation: the wanted message is almost always the last or second last.
+    """
+    for msg in reversed(messages):
+        if getattr(msg, "type", None) == message_type:
+            return msg
+    return None
+
+
+# Messages of recent history kept for chat_node (10 turns of user + assistant)
+CHAT_HISTORY_WINDOW = 20
+
+# LRU cache of stripped message text -> analysis (corrected, issues, explanation)
+CORRECTION_CACHE_SIZE = 512
+_correction_cache: OrderedDict[str, dict] = OrderedDict()
+
+# LRU cache of normalized message text -> guardrail verdict (passed, response)
+GUARDRAIL_CACHE_SIZE = 2048
+_guardrail_cache: OrderedDict[str, dict] = OrderedDict()
+
+# Short replies with no grammar to correct (compared after normalizing)
+TRIVIAL_MESSAGES = frozenset({
+    "yes", "yeah", "yep", "no", "nope", "ok", "okay", "sure", "right",
+    "thanks", "thank you", "thank you so much", "i see", "got it", "of course",
+    "hello", "hi", "hey", "bye", "goodbye", "good morning", "good night",
+    "me too", "not really", "i think so", "i don't know", "no problem",
+    "oh really", "oh no", "oh wow", "oh nice", "that's great", "that's cool",
+})
+
+# Words as the correction prompt sees them (letters and apostrophes)
+_WORD_RE = re.compile(r"[^\W\d_]+(?:'[^\W\d_]+)*")
+
+
+def _is_correction_free(text: str) -> bool:
+    """
+    Whether a message is too trivial to contain a spoken grammar error.
+
+    True for messages with no letters (emoji, numbers), a single word, or a
+    known stock reply. Capitalization and punctuation are ignored, as in the
+    correction prompt.
+    """
+    words = _WORD_RE.findall(text.lower())
+    return len(words) <= 1 or " ".join(words) in TRIVIAL_MESSAGES
+
+
+def _is_guardrail_free(text: str) -> bool:
+    """
+    Whether a message can't be an off-topic task request.
+
+    True only for messages with no letters or a known stock reply. Unlike
+    _is_correction_free, single words still get classified: "translate" or
+    "essay" is a task prompt with no grammar to correct.
+    """
+    words = _WORD_RE.findall(text.lower())
+    return not words or " ".join(words) in TRIVIAL_MESSAGES
+
+
 # Node implementations
 
-def chat_node(state: GraphState) -> dict:
+async def chat_node(state: GraphState) -> dict:
     """
     Generate conversational AI response to user messages.
 
@@ -57,14 +207,9 @@ def chat_node(state: GraphState) -> dict:
         Dictionary with updated messages containing AI response
     """
     logger.info(">>> chat_node started")
-    from langchain_anthropic import ChatAnthropic
-    from langchain_core.messages import SystemMessage
 
-    # Initialize the LLM
-    llm = ChatAnthropic(
-        model="claude-haiku-4-5-20251001",  # type: ignore
-        temperature=0.7,  # Slightly creative for natural conversation
-    )
+    # Slightly creative for natural conversation
+    llm = _get_llm("claude-haiku-4-5-20251001", 0.7)
 
     # Optimized system prompt for natural conversation (~40% fewer tokens)
     system_prompt = """You're a friendly conversation partner helping someone practice English.
@@ -79,17 +224,17 @@ Key behaviors:
 
 Goal: Make speaking English feel fun, not like a test."""
 
-    # Prepare messages with system prompt
-    messages = [SystemMessage(content=system_prompt)] + list(state["messages"])
+    # Prepare messages with system prompt and recent history
+    messages = [_system_message(system_prompt), *_history_window(state["messages"])]
 
-    # Generate response
-    response = llm.invoke(messages)
+    # Generate response (awaited so the event loop keeps serving other streams)
+    response = await llm.ainvoke(messages)
 
     logger.info("<<< chat_node finished")
     return {"messages": [response]}
 
 
-def correction_node(state: GraphState) -> dict:
+async def correction_node(state: GraphState) -> dict:
     """
     Analyze user's last message for grammar errors and provide corrections.
 
@@ -103,28 +248,41 @@ def correction_node(state: GraphState) -> dict:
         Dictionary with updated corrections list
     """
     logger.info(">>> correction_node started")
-    from langchain_anthropic import ChatAnthropic
-    from langchain_core.messages import SystemMessage, HumanMessage
-    import json
 
     # Get the last user message
-    user_messages = [msg for msg in state["messages"]
-                     if hasattr(msg, 'type') and msg.type == "human"]
-    if not user_messages:
+    last_user_message = _last_message(state["messages"], "human")
+    if last_user_message is None:
         logger.info("<<< correction_node finished (no user messages)")
         return {"corrections": []}
 
-    last_user_message = user_messages[-1]
     message_content = last_user_message.content
 
     # Generate a simple message ID (could use UUID in production)
     message_id = f"msg_{len(state['messages'])}"
 
-    # Initialize the LLM
-    llm = ChatAnthropic(
-        model="claude-sonnet-4-5-20250929",  # type: ignore
-        temperature=0.3,  # Lower temperature for more consistent corrections
-    )
+    # Nothing to correct in "ok" / "yes" / emoji-only replies: skip Claude
+    if _is_correction_free(message_content):
+        correction = {
+            "original": message_content,
+            "corrected": message_content,
+            "issues": [],
+            "explanation": "",
+            "message_id": message_id
+        }
+        logger.info("<<< correction_node finished (trivial message)")
+        return {"corrections": state.get("corrections", []) + [correction]}
+
+    # Practice phrases repeat a lot: reuse the analysis of an identical message
+    cache_key = message_content.strip()
+    cached = _correction_cache.get(cache_key)
+    if cached is not None:
+        _correction_cache.move_to_end(cache_key)
+        correction = {**cached, "original": message_content, "message_id": message_id}
+        logger.info("<<< correction_node finished (cached)")
+        return {"corrections": state.get("corrections", []) + [correction]}
+
+    # Lower temperature for more consistent corrections
+    llm = _get_llm("claude-haiku-4-5-20251001", 0.3)
 
     # Optimized system prompt for grammar correction (~50% fewer tokens)
     system_prompt = """Analyze spoken English for grammar errors. Input is from speech-to-text.
@@ -161,39 +319,23 @@ Correct output:
   "explanation": "Perfect! Your grammar is spot on here. Great job! 🎉"
 }
 
-Output format (JSON):
-{
-  "original": "the exact transcribed message",
-  "corrected": "grammar-corrected version (keep original capitalization/punctuation)",
-  "issues": ["specific grammar error: 'wrong' → 'correct'"],
-  "explanation": "A friendly 1-2 sentence explanation focused on the speaking error"
-}
-
 Be encouraging! Focus on helping them speak more naturally and confidently."""
 
     # Create the correction request
     correction_request = f"Please analyze this message for grammar errors:\n\n\"{message_content}\""
 
     messages = [
-        SystemMessage(content=system_prompt),
+        _system_message(system_prompt),
         HumanMessage(content=correction_request)
     ]
 
-    # Generate correction
-    response = llm.invoke(messages)
-
-    # Parse the JSON response
-    try:
-        from utils import strip_markdown_code_blocks
-
-        # Ensure response.content is a string
-        content = response.content if isinstance(
-            response.content, str) else str(response.content)
-
-        # Strip markdown code blocks if present (Claude sometimes wraps JSON)
-        content = strip_markdown_code_blocks(content)
+    # Generate correction as a forced tool call matching CorrectionAnalysis,
+    # so there is no markdown wrapper or free-form JSON to parse
+    result = await llm.with_structured_output(
+        CorrectionAnalysis, include_raw=True).ainvoke(messages)
 
-        correction_data = json.loads(content)
+    correction_data = result["parsed"]
+    if isinstance(correction_data, dict) and result.get("parsing_error") is None:
         correction = {
             "original": correction_data.get("original", message_content),
             "corrected": correction_data.get("corrected", message_content),
@@ -202,86 +344,85 @@ Be encouraging! Focus on helping them speak more naturally and confidently."""
             "message_id": message_id
         }
 
+        # Only successful analyses are cached (fallbacks are retried)
+        _correction_cache[cache_key] = {
+            k: correction[k] for k in ("corrected", "issues", "explanation")}
+        if len(_correction_cache) > CORRECTION_CACHE_SIZE:
+            _correction_cache.popitem(last=False)
+
         # Append to corrections list
         new_corrections = state.get("corrections", []) + [correction]
         logger.info("<<< correction_node finished")
         return {"corrections": new_corrections}
 
-    except json.JSONDecodeError:
-        # Fallback if JSON parsing fails
-        fallback_correction = {
-            "original": message_content,
-            "corrected": message_content,
-            "issues": [],
-            "explanation": "Unable to analyze grammar at this time.",
-            "message_id": message_id
-        }
-        new_corrections = state.get("corrections", []) + [fallback_correction]
-        logger.info("<<< correction_node finished (fallback)")
-        return {"corrections": new_corrections}
+    # Fallback if Claude didn't return a valid analysis
+    fallback_correction = {
+        "original": message_content,
+        "corrected": message_content,
+        "issues": [],
+        "explanation": "Unable to analyze grammar at this time.",
+        "message_id": message_id
+    }
+    new_corrections = state.get("corrections", []) + [fallback_correction]
+    logger.info("<<< correction_node finished (fallback)")
+    return {"corrections": new_corrections}
 
 
-def tts_node(state: GraphState) -> dict:
+async def tts_node(state: GraphState, config: RunnableConfig) -> dict:
     """
     Generate text-to-speech audio for the AI chat response.
 
     Uses OpenAI TTS API with model 'tts-1', voice 'nova', format 'opus'.
-    Audio is returned as base64-encoded data for SSE streaming.
+    The raw audio bytes are handed to the run's audio sink (see _emit_audio);
+    the /chat endpoint sends them as binary WebSocket frames or base64-encodes
+    them for SSE.
 
-    IMPORTANT: Audio data is NOT added to graph state to avoid bloating
-    checkpoints. The audio is only returned in the stream output.
+    IMPORTANT: Audio data is NOT added to graph state, so checkpoints never
+    store (or copy) it.
 
     Args:
         state: Current graph state with conversation history
+        config: Run config; configurable["audio_sink"] receives the audio
 
     Returns:
-        Dictionary with tts_audio (base64) and tts_format, or empty dict on error
+        Empty dictionary (no state updates)
     """
     logger.info(">>> tts_node started")
-    import base64
-    from openai import OpenAI
 
     # Get the last AI message from conversation history
-    ai_messages = [msg for msg in state["messages"]
-                   if hasattr(msg, 'type') and msg.type == "ai"]
+    last_ai_message = _last_message(state["messages"], "ai")
 
-    if not ai_messages:
+    if last_ai_message is None:
         # No AI message to convert - skip TTS
         logger.info("<<< tts_node finished (no AI messages)")
-        return {"tts_audio": None, "tts_format": None}
+        return {}
 
-    last_ai_message = ai_messages[-1]
     text_content = last_ai_message.content
 
     # Handle empty or null chat responses (task 2.5)
     if not text_content or not text_content.strip():
         logger.info("<<< tts_node finished (empty response)")
-        return {"tts_audio": None, "tts_format": None}
+        return {}
 
     try:
-        # Initialize OpenAI client (reads OPENAI_API_KEY from env)
-        client = OpenAI()
+        client = get_openai_client()
 
         # Call OpenAI TTS API (task 2.2)
         # Model: tts-1 (low latency), Voice: nova (friendly), Format: opus (small size)
-        response = client.audio.speech.create(
+        response = await client.audio.speech.create(
             model="tts-1",
             voice="nova",
             input=text_content,
             response_format="opus"
         )
 
-        # Get audio bytes and encode as base64 (task 2.3)
+        # Get audio bytes (task 2.3)
         audio_bytes = response.content
-        audio_base64 = base64.b64encode(audio_bytes).decode("utf-8")
 
-        # Return audio data for SSE streaming (task 2.6)
-        # Note: This is NOT added to GraphState - only accessible during streaming
+        # Hand audio data to the stream (task 2.6), outside GraphState
+        _emit_audio(config, audio_bytes, "opus")
         logger.info("<<< tts_node finished")
-        return {
-            "tts_audio": audio_base64,
-            "tts_format": "opus"
-        }
+        return {}
 
     except Exception as e:
         # Error handling for TTS API failures (task 2.4)
@@ -296,10 +437,10 @@ def tts_node(state: GraphState) -> dict:
             exc_info=True
         )
         logger.info("<<< tts_node finished (error)")
-        return {"tts_audio": None, "tts_format": None}
+        return {}
 
 
-def chat_and_tts_node(state: GraphState) -> dict:
+async def chat_and_tts_node(state: GraphState, config: RunnableConfig) -> dict:
     """
     Combined chat + TTS node to avoid superstep blocking.
 
@@ -310,27 +451,50 @@ def chat_and_tts_node(state: GraphState) -> dict:
 
     Args:
         state: Current graph state with conversation history
+        config: Run config, passed through to tts_node
 
     Returns:
-        Dictionary with both chat messages and TTS audio data
+        Dictionary with chat messages (TTS audio goes to the audio sink)
     """
     logger.info(">>> chat_and_tts_node started")
 
     # Step 1: Execute chat
-    chat_result = chat_node(state)
+    chat_result = await chat_node(state)
 
     # Step 2: Execute TTS with updated state (includes new AI message)
     updated_state = {**state, **chat_result}
-    tts_result = tts_node(updated_state)
-
-    # Combine results
-    combined_result = {**chat_result, **tts_result}
+    await tts_node(updated_state, config)
 
     logger.info("<<< chat_and_tts_node finished")
-    return combined_result
+    return chat_result
 
 
-def guardrail_node(state: GraphState) -> dict:
+def _guardrail_update(result: GuardrailVerdict) -> dict:
+    """
+    Turn a guardrail verdict into a state update.
+
+    Args:
+        result: Classification from Claude (or the guardrail cache)
+
+    Returns:
+        Dictionary with guardrail_passed bool and optional rejection AIMessage
+    """
+    if result.get("passed", True):
+        logger.info("<<< guardrail_node finished (passed)")
+        return {"guardrail_passed": True}
+
+    # Return rejection message as AIMessage
+    rejection_message = result.get("response") or (
+        "I'm here to help you practice English conversation! "
+        "Let's chat about topics you're interested in instead.")
+    logger.info("<<< guardrail_node finished (rejected)")
+    return {
+        "guardrail_passed": False,
+        "messages": [AIMessage(content=rejection_message)]
+    }
+
+
+async def guardrail_node(state: GraphState) -> dict:
     """
     Classify user intent and filter task requests.
 
@@ -345,25 +509,30 @@ def guardrail_node(state: GraphState) -> dict:
         Dictionary with guardrail_passed bool and optional rejection AIMessage
     """
     logger.info(">>> guardrail_node started")
-    from langchain_anthropic import ChatAnthropic
-    from langchain_core.messages import SystemMessage, HumanMessage, AIMessage
-    import json
 
     # Get the last user message
-    user_messages = [msg for msg in state["messages"]
-                     if hasattr(msg, 'type') and msg.type == "human"]
-    if not user_messages:
+    last_user_message = _last_message(state["messages"], "human")
+    if last_user_message is None:
         logger.info("<<< guardrail_node finished (no user messages)")
         return {"guardrail_passed": True}
 
-    last_user_message = user_messages[-1]
     message_content = last_user_message.content
 
-    # Initialize Claude Haiku for fast classification
-    llm = ChatAnthropic(
-        model="claude-haiku-4-5-20251001",  # type: ignore
-        temperature=0.3,  # Consistent classification
-    )
+    # "ok" / "thanks" / emoji-only replies can't be task requests: skip Claude
+    if _is_guardrail_free(message_content):
+        logger.info("<<< guardrail_node finished (trivial message, passed)")
+        return {"guardrail_passed": True}
+
+    # Greetings and small talk recur verbatim across threads: reuse the verdict
+    cache_key = " ".join(message_content.lower().split())
+    cached = _guardrail_cache.get(cache_key)
+    if cached is not None:
+        _guardrail_cache.move_to_end(cache_key)
+        logger.info("guardrail_node cache hit")
+        return _guardrail_update(cached)
+
+    # Claude Haiku for fast, consistent classification
+    llm = _get_llm("claude-haiku-4-5-20251001", 0.3)
 
     system_prompt = """You classify user messages for an English conversation practice app.
 
@@ -388,55 +557,31 @@ Examples:
 - "What do you think about AI?" → passed: true (asking opinion)
 - "Translate this paragraph to Chinese" → passed: false (task request)
 
-Output JSON only:
-{
-  "passed": true/false,
-  "response": null if passed, or friendly rejection message if not passed
-}
-
 For rejections, be warm and redirect to conversation (max 30 words):
 - Acknowledge their interest
 - Explain this is for conversation practice
 - Suggest discussing the topic instead"""
 
     messages = [
-        SystemMessage(content=system_prompt),
+        _system_message(system_prompt),
         HumanMessage(
             content=f"Classify this message:\n\n\"{message_content}\"")
     ]
 
-    response = llm.invoke(messages)
-
-    # Parse JSON response
-    try:
-        from utils import strip_markdown_code_blocks
-
-        content = response.content if isinstance(
-            response.content, str) else str(response.content)
-        content = strip_markdown_code_blocks(content)
+    result = await llm.with_structured_output(
+        GuardrailVerdict, include_raw=True).ainvoke(messages)
 
-        result = json.loads(content)
-        passed = result.get("passed", True)
-
-        if passed:
-            logger.info("<<< guardrail_node finished (passed)")
-            return {"guardrail_passed": True}
-        else:
-            # Return rejection message as AIMessage
-            rejection_message = result.get("response",
-                                           "I'm here to help you practice English conversation! "
-                                           "Let's chat about topics you're interested in instead.")
-            logger.info("<<< guardrail_node finished (rejected)")
-            return {
-                "guardrail_passed": False,
-                "messages": [AIMessage(content=rejection_message)]
-            }
-
-    except json.JSONDecodeError:
-        # On parse failure, allow the message through
+    verdict = result["parsed"]
+    if not isinstance(verdict, dict) or result.get("parsing_error") is not None:
+        # On invalid output, allow the message through (not cached)
         logger.info("<<< guardrail_node finished (parse error, passed)")
         return {"guardrail_passed": True}
 
+    _guardrail_cache[cache_key] = verdict
+    if len(_guardrail_cache) > GUARDRAIL_CACHE_SIZE:
+        _guardrail_cache.popitem(last=False)
+    return _guardrail_update(verdict)
+
 
 # Graph construction
 
@@ -469,15 +614,16 @@ def create_workflow():
                             -> [reject] -> tts -> END
 
     The guardrail node classifies intent first.
-    On pass: chat_tts and correction run in parallel. chat_tts combines chat
-             and TTS into a single node so TTS starts immediately after chat
-             without waiting for correction to complete.
+    On pass: chat_tts and correction run in parallel. Both are coroutines, so
+             under astream their Claude calls overlap on the event loop and
+             each node's update is streamed as soon as it finishes. chat_tts
+             combines chat and TTS into a single node so TTS starts
+             immediately after chat without waiting for correction to complete.
     On reject: TTS generates audio for the rejection message.
 
     Returns:
         Compiled StateGraph ready for execution
     """
-    from langgraph.graph import StateGraph, END
 
     # Initialize the graph with our state schema
     workflow = StateGraph(GraphState)
@@ -510,28 +656,46 @@ def create_workflow():
     return workflow
 
 
-def get_checkpointer():
+@asynccontextmanager
+async def open_checkpointer() -> AsyncIterator[BaseCheckpointSaver]:
     """
-    Get the appropriate checkpointer for thread persistence.
+    Open the appropriate checkpointer for thread persistence.
 
-    Development: Uses MemorySaver (in-memory, simple setup)
-    Production: TODO - Switch to Redis or PostgreSQL checkpointer
+    With CHECKPOINT_DB set (a SQLite file path) and the `sqlite` extra
+    installed (`uv sync --extra sqlite`), threads persist across restarts in
+    SQLite. Otherwise uses MemorySaver (in-memory, simple setup).
 
-    Returns:
+    Used as the server lifespan's context, so the SQLite connection (and its
+    aiosqlite worker thread) is closed on shutdown.
+
+    Yields:
         Checkpointer instance for thread state persistence
     """
-    from langgraph.checkpoint.memory import MemorySaver
 
-    # For development, use in-memory checkpointer
-    # TODO: For production, use Redis or PostgreSQL:
-    # from langgraph.checkpoint.postgres import PostgresSaver
-    # or
-    # from langgraph.checkpoint.redis import RedisSaver
+    # Endpoints read state with aget_state/astream, so any replacement must
+    # implement the async checkpointer API to keep I/O off the event loop.
+    db_path = os.getenv("CHECKPOINT_DB")
+    if db_path:
+        try:
+            from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+        except ImportError:
+            logger.warning(
+                "CHECKPOINT_DB is set but langgraph-checkpoint-sqlite is not "
+                "installed (uv sync --extra sqlite) - falling back to "
+                "in-memory checkpoints"
+            )
+        else:
+            async with AsyncSqliteSaver.from_conn_string(db_path) as saver:
+                yield saver
+            return
+
+    # TODO: For multi-instance production, use Redis or PostgreSQL:
+    # from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver
 
-    return MemorySaver()
+    yield MemorySaver()
 
 
-def compile_graph():
+def compile_graph(checkpointer: BaseCheckpointSaver | None = None):
     """
     Compile the complete graph with checkpointer for execution.
 
@@ -540,11 +704,16 @@ def compile_graph():
     - Parallel execution edges
     - Thread persistence via checkpointer
 
+    Args:
+        checkpointer: Checkpointer from open_checkpointer (owned by the
+            caller); a fresh MemorySaver if omitted
+
     Returns:
         Compiled graph ready for streaming execution
     """
     workflow = create_workflow()
-    checkpointer = get_checkpointer()
+    if checkpointer is None:
+        checkpointer = MemorySaver()
 
     # Compile with checkpointer for thread persistence
     graph = workflow.compile(checkpointer=checkpointer)
@@ -2,20 +2,30 @@
 IELTS RAG Pipeline for vocabulary suggestions.
 
 This module provides the core RAG pipeline that:
-1. Extracts keywords from corrected sentences using Claude Haiku
+1. Extracts candidate keywords from corrected sentences (local, no LLM call)
 2. Searches FAISS index for relevant IELTS vocabulary
-3. Generates usage context explanations using Claude Haiku
+3. Picks the fitting suggestions and explains their usage using Claude Haiku
 """
 
-import json
+import asyncio
 import logging
+import os
+import re
+from collections import Counter, OrderedDict
+from collections.abc import AsyncIterator
+from functools import lru_cache
 from typing import TypedDict
 
+import faiss
+import numpy as np
+import orjson
 from langchain_anthropic import ChatAnthropic
 from langchain_community.vectorstores import FAISS
+from langchain_community.vectorstores.utils import DistanceStrategy
 from langchain_core.messages import SystemMessage, HumanMessage
+from langchain_core.utils.json import parse_partial_json
 
-from utils import strip_markdown_code_blocks
+from utils import content_text, strip_markdown_code_blocks
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
@@ -27,6 +37,77 @@ TOP_K_RESULTS = 1
 # FAISS L2 distance: lower = more similar. Typical range 0.3-1.5
 SCORE_THRESHOLD = 1.3
 
+# Equivalent threshold for inner-product indexes over normalized vectors:
+# higher = more similar, cosine = 1 - L2² / 2
+SIMILARITY_THRESHOLD = 1 - SCORE_THRESHOLD / 2
+
+# Candidate keywords searched per summary, and suggestions kept from them
+MAX_KEYWORDS = 6
+MAX_SUGGESTIONS = 4
+
+# Fewer candidate keywords than this ("Hello.", "I like it") isn't worth an
+# embedding, FAISS and Claude round trip: no suggestions
+MIN_KEYWORDS = 2
+
+# Function words, pronouns, auxiliaries and fillers: never worth replacing
+STOPWORDS = frozenset("""
+a about above after again against all also am an and any are around as at
+back be because been before being below between both but by can could did do
+does doing done down during each even ever every few for from further get gets
+got had has have having he her here hers herself him himself his how however
+i if in into is it its itself just let like many may me might more most much
+must my myself no nor not now of off often on once only or other our ours
+ourselves out over own quite rather really same she should since so some
+something still such than that the their theirs them themselves then there
+these they this those though through to today tomorrow too under until up upon
+us very was we were what when where which while who whom whose why will with
+would yeah yes yesterday yet you your yours yourself yourselves gonna wanna um
+uh okay ok oh hello hey thanks thank please bye goodbye
+""".split())
+
+# Lowercase words, no digits; contractions ("don't") are skipped as keywords
+_KEYWORD_RE = re.compile(r"[a-z]+(?:'[a-z]+)?")
+
+# LRU cache of keyword -> its FAISS hits (score row, index row). Learners reuse
+# the same basic words ("good", "big", "go"), so most lookups skip Bedrock.
+SEARCH_CACHE_SIZE = 4096
+_search_cache: OrderedDict[str, tuple[np.ndarray, np.ndarray]] = OrderedDict()
+
+# Default cap on in-flight Bedrock embedding calls (BEDROCK_CONCURRENCY)
+DEFAULT_BEDROCK_CONCURRENCY = 8
+
+
+def is_relevant(score: float | np.ndarray, faiss_index: FAISS) -> bool | np.ndarray:
+    """
+    Check a FAISS score against the threshold for the index's metric.
+
+    Also accepts a score array from index.search, returning a boolean mask.
+    """
+    if faiss_index.distance_strategy == DistanceStrategy.MAX_INNER_PRODUCT:
+        return score >= SIMILARITY_THRESHOLD
+    return score <= SCORE_THRESHOLD
+
+
+# Usage explanation model settings (shared by the interactive and batch paths)
+USAGE_MODEL = "claude-haiku-4-5-20251001"
+USAGE_TEMPERATURE = 0.3
+USAGE_MAX_TOKENS = 1024
+
+
+@lru_cache(maxsize=1)
+def _get_llm() -> ChatAnthropic:
+    """
+    Get the shared Claude Haiku client for usage explanations.
+
+    Created on first use (after .env is loaded) and reused across summaries
+    so the underlying HTTP connection pool stays warm.
+    """
+    return ChatAnthropic(
+        model=USAGE_MODEL,  # type: ignore
+        temperature=USAGE_TEMPERATURE,
+        max_tokens=USAGE_MAX_TOKENS,
+    )
+
 
 class ExtractedKeywords(TypedDict):
     """Keywords extracted from corrected sentences."""
@@ -47,63 +128,47 @@ class IELTSSuggestions(TypedDict):
     suggestions: list[WordSuggestion]
 
 
-async def extract_keywords(corrected_sentences: list[str]) -> ExtractedKeywords:
+def extract_keywords(corrected_sentences: list[str]) -> ExtractedKeywords:
     """
-    Extract replaceable words from corrected sentences.
+    Pick candidate replaceable words from corrected sentences.
 
-    Uses Claude Haiku for fast, cost-effective extraction.
+    A local heuristic instead of a Claude call: content words (not
+    STOPWORDS, 3+ letters) ranked by how often the learner used them.
+    Candidates that have no close IELTS match are dropped by the FAISS
+    relevance threshold, and unsuitable pairs by generate_usage_explanations.
 
     Args:
         corrected_sentences: List of grammar-corrected sentences from user
 
     Returns:
-        ExtractedKeywords with replaceable_words
+        ExtractedKeywords with up to MAX_KEYWORDS replaceable_words
     """
-    if not corrected_sentences:
-        return {"replaceable_words": []}
-
-    llm = ChatAnthropic(
-        model="claude-haiku-4-5-20251001",
-        temperature=0.0,  # Deterministic for consistent extraction
+    counts = Counter(
+        word for word in _KEYWORD_RE.findall(" ".join(corrected_sentences).lower())
+        if len(word) >= 3 and "'" not in word and word not in STOPWORDS
     )
+    return {
+        "replaceable_words": [word for word, _ in counts.most_common(MAX_KEYWORDS)],
+    }
 
-    system_prompt = """Extract vocabulary from the given sentences for IELTS vocabulary enhancement.
 
-Output JSON with one array:
-- "replaceable_words": Common words that could be replaced with more advanced IELTS vocabulary (nouns, verbs, adjectives, adverbs). Focus on simple/basic words like "store", "big", "good", "go", "make", etc.
+@lru_cache(maxsize=1)
+def _get_bedrock_semaphore() -> asyncio.Semaphore:
+    """
+    Get the cap on in-flight Bedrock embedding calls across all summaries.
 
-Rules:
-- Only include words actually present in the sentences
-- Extract 3-5 replaceable words maximum
-- Ignore function words (the, a, is, etc.)
+    Sized by BEDROCK_CONCURRENCY (the account's Titan rate limit) so bursts
+    queue here instead of being throttled. Created on first use, after
+    main.py has loaded .env.
+    """
+    return asyncio.Semaphore(
+        int(os.getenv("BEDROCK_CONCURRENCY") or DEFAULT_BEDROCK_CONCURRENCY))
 
-Example input: "I went to the store yesterday and bought many things."
-Example output:
-{
-  "replaceable_words": ["store", "bought", "things"]
-}
 
-Output valid JSON only, no other text."""
-
-    combined_text = " ".join(corrected_sentences)
-    messages = [
-        SystemMessage(content=system_prompt),
-        HumanMessage(content=f"Sentences: {combined_text}")
-    ]
-
-    try:
-        response = await llm.ainvoke(messages)
-        content = response.content if isinstance(
-            response.content, str) else str(response.content)
-        content = strip_markdown_code_blocks(content)
-
-        result = json.loads(content)
-        return {
-            "replaceable_words": result.get("replaceable_words", []),
-        }
-    except (json.JSONDecodeError, Exception) as e:
-        logger.warning(f"Keyword extraction failed: {e}")
-        return {"replaceable_words": []}
+async def _embed_query(faiss_index: FAISS, text: str) -> list[float]:
+    """Embed one query with Bedrock, waiting for a free concurrency slot."""
+    async with _get_bedrock_semaphore():
+        return await faiss_index.embeddings.aembed_query(text)
 
 
 async def search_ielts_vocabulary(
@@ -123,189 +188,356 @@ async def search_ielts_vocabulary(
     if not keywords["replaceable_words"]:
         return []
 
-    results: list[dict] = []
-    seen_words = set()
+    query_words = keywords["replaceable_words"][:MAX_KEYWORDS]
 
-    for keyword in keywords["replaceable_words"][:4]:  # Limit to first 4 keywords
+    # Only keywords not searched before need an embedding + index search
+    rows: dict[str, tuple[np.ndarray, np.ndarray]] = {}
+    misses = []
+    for keyword in dict.fromkeys(query_words):
+        cached = _search_cache.get(keyword)
+        if cached is None:
+            misses.append(keyword)
+        else:
+            _search_cache.move_to_end(keyword)
+            rows[keyword] = cached
+
+    if misses:
         try:
-            # Perform similarity search with scores
-            docs_with_scores = await faiss_index.asimilarity_search_with_score(
-                keyword, k=TOP_K_RESULTS
+            # Embed the misses concurrently, then search the index once for the batch
+            vectors = np.asarray(
+                await asyncio.gather(*(_embed_query(faiss_index, k) for k in misses)),
+                dtype=np.float32,
             )
+            if faiss_index._normalize_L2:
+                faiss.normalize_L2(vectors)
+            miss_scores, miss_indices = faiss_index.index.search(vectors, TOP_K_RESULTS)
+        except Exception as e:
+            logger.warning(f"FAISS search failed for keywords {misses}: {e}")
+            return []
 
-            for doc, score in docs_with_scores:
-                logger.debug(
-                    f"FAISS search result for '{keyword}': {doc.metadata.get('word')} "
-                    f"(score: {score:.3f})"
-                )
-
-                # Filter out low-relevance results (higher score = less similar)
-                if score > SCORE_THRESHOLD:
-                    logger.debug(
-                        f"Skipping '{doc.metadata.get('word')}' - "
-                        f"score {score:.3f} exceeds threshold {SCORE_THRESHOLD}"
-                    )
-                    continue
+        for keyword, row_scores, row_indices in zip(misses, miss_scores, miss_indices):
+            rows[keyword] = _search_cache[keyword] = (row_scores, row_indices)
+            if len(_search_cache) > SEARCH_CACHE_SIZE:
+                _search_cache.popitem(last=False)
 
-                word = doc.metadata.get("word", "")
-                # Skip duplicates and the keyword itself
-                if word.lower() in seen_words or word.lower() == keyword.lower():
-                    continue
+    scores = np.stack([rows[k][0] for k in query_words])
+    indices = np.stack([rows[k][1] for k in query_words])
 
-                seen_words.add(word.lower())
-                results.append({
-                    "target_word": keyword,
-                    "ielts_word": word,
-                    "definition": doc.metadata.get("definition", ""),
-                    "example": doc.metadata.get("sentence", ""),
-                })
-        except Exception as e:
-            logger.warning(f"FAISS search failed for keyword '{keyword}': {e}")
-            continue
+    # Filter out low-relevance results (and -1 padding) for the whole batch at once
+    relevant = is_relevant(scores, faiss_index) & (indices != -1)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            f"FAISS scores for {query_words}: {scores.tolist()} "
+            f"({int(relevant.sum())} pass relevance threshold)"
+        )
 
-    return results
+    results: list[dict] = []
+    seen_words = set()
 
+    for row, col in zip(*np.nonzero(relevant)):
+        keyword = query_words[row]
+        doc = faiss_index.docstore.search(
+            faiss_index.index_to_docstore_id[int(indices[row, col])])
 
-async def generate_usage_explanations(
-    vocabulary_matches: list[dict],
-) -> list[WordSuggestion]:
-    """
-    Generate usage context explanations for vocabulary suggestions.
+        word = doc.metadata.get("word", "")
+        # Skip duplicates and the keyword itself (keywords are already lowercase)
+        word_lower = word.lower()
+        if word_lower in seen_words or word_lower == keyword:
+            continue
 
-    Uses Claude Haiku to explain when/how to use each IELTS word
-    compared to the simpler alternative.
+        seen_words.add(word_lower)
+        results.append({
+            "target_word": keyword,
+            "ielts_word": word,
+            "definition": doc.metadata.get("definition", ""),
+            "example": doc.metadata.get("sentence", ""),
+        })
 
-    Args:
-        vocabulary_matches: List of vocabulary matches from FAISS search
+    return results
 
-    Returns:
-        List of WordSuggestion with usage_context filled in
-    """
-    if not vocabulary_matches:
-        return []
 
-    llm = ChatAnthropic(
-        model="claude-haiku-4-5-20251001",
-        temperature=0.3,
-    )
+# Static system prompt for stream_usage_explanations. No prompt-cache
+# breakpoint: it is far below Haiku's minimum cacheable prefix
+USAGE_SYSTEM_PROMPT = f"""You are an English vocabulary coach helping learners expand their vocabulary.
 
-    system_prompt = """You are an English vocabulary coach helping learners expand their vocabulary.
+You get a learner's sentences and candidate word pairs (simple word → advanced IELTS word).
+Keep only pairs where the advanced word could naturally replace the simple word as the
+learner used it (same meaning and part of speech), at most {MAX_SUGGESTIONS} pairs.
 
-For each word pair, explain WHEN and WHERE to use the advanced word vs the simple word.
+For each kept pair, explain WHEN and WHERE to use the advanced word vs the simple word.
 Focus on practical usage scenarios (casual speech vs formal writing, specific contexts).
 
-Output JSON array with usage_context for each word:
+Output JSON array with usage_context for each kept pair:
 [
-  {
+  {{
     "target_word": "store",
     "ielts_word": "establishment",
     "usage_context": "Use 'store' in casual conversation. 'Establishment' is more formal, suitable for IELTS writing, business reports, or when describing institutions."
-  }
+  }}
 ]
 
 Rules:
 - Keep explanations concise (1-2 sentences in English)
 - Be practical - focus on real usage scenarios
 - Don't be preachy - just explain the difference
+- Output [] if no pair fits
 
 Output valid JSON only."""
 
+USAGE_SYSTEM_MESSAGE = SystemMessage(content=USAGE_SYSTEM_PROMPT)
+
+
+def _suggestion(match: dict, usage_context: str) -> WordSuggestion:
+    """Build a suggestion from a vocabulary match and its usage explanation."""
+    return {
+        "target_word": match["target_word"],
+        "ielts_word": match["ielts_word"],
+        "definition": match["definition"],
+        "example": match["example"],
+        "usage_context": usage_context,
+    }
+
+
+def _without_usage_context(vocabulary_matches: list[dict]) -> list[WordSuggestion]:
+    """Build suggestions with an empty usage_context (fallback on failure)."""
+    return [_suggestion(v, "") for v in vocabulary_matches]
+
+
+def usage_explanation_request(
+    vocabulary_matches: list[dict],
+    corrected_sentences: list[str],
+) -> str:
+    """
+    Build the user message sent with USAGE_SYSTEM_MESSAGE.
+
+    Args:
+        vocabulary_matches: List of vocabulary matches from FAISS search
+        corrected_sentences: The sentences the target words came from
+
+    Returns:
+        The sentences and candidate word pairs as prompt text
+    """
     word_pairs = "\n".join([
         f"- {v['target_word']} → {v['ielts_word']} ({v['definition']})"
         for v in vocabulary_matches
     ])
+    sentences = "\n".join(f"- {s}" for s in corrected_sentences)
+    return f"Sentences:\n{sentences}\n\nWord pairs:\n{word_pairs}"
 
-    messages = [
-        SystemMessage(content=system_prompt),
-        HumanMessage(
-            content=f"Generate usage context for these word pairs:\n{word_pairs}")
-    ]
 
-    try:
-        response = await llm.ainvoke(messages)
-        content = response.content if isinstance(
-            response.content, str) else str(response.content)
-        content = strip_markdown_code_blocks(content)
+def parse_usage_explanations(
+    content: str,
+    vocabulary_matches: list[dict],
+) -> list[WordSuggestion]:
+    """
+    Merge Claude's usage explanations into the vocabulary matches it kept.
 
-        explanations = json.loads(content)
+    Args:
+        content: Claude's response text (a JSON array, maybe code-fenced)
+        vocabulary_matches: The matches the request was built from
+
+    Returns:
+        Up to MAX_SUGGESTIONS WordSuggestions with usage_context filled in,
+        or the closest matches without usage_context if content is invalid
+    """
+    try:
+        explanations = orjson.loads(strip_markdown_code_blocks(content))
 
-        # Build a map of usage contexts
+        # Build a map of usage contexts for the pairs Claude kept
         context_map = {
             e["target_word"]: e.get("usage_context", "")
             for e in explanations
             if "target_word" in e
         }
+    except (orjson.JSONDecodeError, TypeError, AttributeError) as e:
+        logger.warning(f"Usage explanation parsing failed: {e}")
+        return _without_usage_context(vocabulary_matches[:MAX_SUGGESTIONS])
 
-        # Merge usage_context into vocabulary matches
-        result: list[WordSuggestion] = []
-        for v in vocabulary_matches:
-            result.append({
-                "target_word": v["target_word"],
-                "ielts_word": v["ielts_word"],
-                "definition": v["definition"],
-                "example": v["example"],
-                "usage_context": context_map.get(v["target_word"], ""),
-            })
+    # Merge usage_context into the kept vocabulary matches
+    result = [
+        _suggestion(v, context_map[v["target_word"]])
+        for v in vocabulary_matches
+        if v["target_word"] in context_map
+    ]
+    return result[:MAX_SUGGESTIONS]
 
-        return result
 
-    except (json.JSONDecodeError, Exception) as e:
+def _completed_explanations(content: str) -> list[dict]:
+    """
+    Get the explanation objects a partial JSON array response has finished.
+
+    The last object parsed from a partial response may still be streaming,
+    so it only counts once a later object has started.
+    """
+    partial = parse_partial_json(strip_markdown_code_blocks(content))
+    if not isinstance(partial, list):
+        return []
+    return [e for e in partial[:-1] if isinstance(e, dict)]
+
+
+async def stream_usage_explanations(
+    vocabulary_matches: list[dict],
+    corrected_sentences: list[str],
+) -> AsyncIterator[WordSuggestion]:
+    """
+    Choose fitting vocabulary suggestions and explain their usage, streamed.
+
+    One Claude Haiku call both drops pairs that don't fit the learner's
+    sentences and explains when/how to use each remaining IELTS word
+    compared to the simpler alternative. Each suggestion is yielded as soon
+    as Claude finishes its object, so the first one shows up long before the
+    whole response is done.
+
+    Args:
+        vocabulary_matches: List of vocabulary matches from FAISS search
+        corrected_sentences: The sentences the target words came from
+
+    Yields:
+        Up to MAX_SUGGESTIONS WordSuggestions with usage_context filled in
+    """
+    if not vocabulary_matches:
+        return
+
+    messages = [
+        USAGE_SYSTEM_MESSAGE,
+        HumanMessage(content=usage_explanation_request(
+            vocabulary_matches, corrected_sentences))
+    ]
+    matches_by_word = {v["target_word"]: v for v in vocabulary_matches}
+    emitted: set[str] = set()
+
+    content = ""
+    try:
+        async for chunk in _get_llm().astream(messages):
+            content += content_text(chunk.content)
+            for e in _completed_explanations(content):
+                target_word = e.get("target_word")
+                if (target_word in emitted or target_word not in matches_by_word
+                        or len(emitted) >= MAX_SUGGESTIONS):
+                    continue
+                emitted.add(target_word)
+                yield _suggestion(
+                    matches_by_word[target_word], e.get("usage_context", ""))
+    except Exception as e:
         logger.warning(f"Usage explanation generation failed: {e}")
-        # Return without usage_context on failure
-        return [
-            {
-                "target_word": v["target_word"],
-                "ielts_word": v["ielts_word"],
-                "definition": v["definition"],
-                "example": v["example"],
-                "usage_context": "",
-            }
-            for v in vocabulary_matches
-        ]
+        # Fall through: the closest matches go out without usage_context
+        content = ""
 
+    # The final object (or every pair, as a fallback) once the response is complete
+    for suggestion in parse_usage_explanations(content, vocabulary_matches):
+        if len(emitted) >= MAX_SUGGESTIONS:
+            break
+        if suggestion["target_word"] not in emitted:
+            emitted.add(suggestion["target_word"])
+            yield suggestion
 
-async def run_ielts_rag_pipeline(
+
+async def generate_usage_explanations(
+    vocabulary_matches: list[dict],
+    corrected_sentences: list[str],
+) -> list[WordSuggestion]:
+    """
+    Choose fitting vocabulary suggestions and explain their usage.
+
+    Collects stream_usage_explanations for callers that need the full list.
+
+    Args:
+        vocabulary_matches: List of vocabulary matches from FAISS search
+        corrected_sentences: The sentences the target words came from
+
+    Returns:
+        Up to MAX_SUGGESTIONS WordSuggestions with usage_context filled in
+    """
+    return [
+        suggestion
+        async for suggestion in stream_usage_explanations(
+            vocabulary_matches, corrected_sentences)
+    ]
+
+
+async def find_vocabulary_matches(
     corrected_sentences: list[str],
     faiss_index: FAISS,
-) -> IELTSSuggestions:
+) -> list[dict]:
     """
-    Main pipeline function that orchestrates the IELTS RAG workflow.
+    Run the retrieval steps of the pipeline (keywords, then FAISS search).
+
+    Args:
+        corrected_sentences: List of grammar-corrected sentences from conversation
+        faiss_index: Pre-loaded FAISS index with IELTS vocabulary embeddings
+
+    Returns:
+        Vocabulary matches to pass to generate_usage_explanations
+    """
+    # Step 1: Extract candidate keywords (no LLM round trip)
+    keywords = extract_keywords(corrected_sentences)
+    logger.debug(f"Extracted keywords: {keywords}")
+
+    if len(keywords["replaceable_words"]) < MIN_KEYWORDS:
+        return []
+
+    # Step 2: Search FAISS index for vocabulary matches
+    vocabulary_matches = await search_ielts_vocabulary(keywords, faiss_index)
+    logger.debug(f"Found {len(vocabulary_matches)} vocabulary matches")
+    return vocabulary_matches
+
+
+async def stream_ielts_rag_pipeline(
+    corrected_sentences: list[str],
+    faiss_index: FAISS,
+) -> AsyncIterator[WordSuggestion]:
+    """
+    Run the IELTS RAG workflow, yielding each suggestion as it is ready.
 
     Pipeline steps:
-    1. Extract keywords from corrected sentences (Haiku)
+    1. Extract candidate keywords from corrected sentences (local)
     2. Search FAISS index for relevant IELTS vocabulary
-    3. Generate usage context explanations (Haiku)
+    3. Pick fitting suggestions and explain their usage (Haiku, streamed)
 
     Args:
         corrected_sentences: List of grammar-corrected sentences from conversation
         faiss_index: Pre-loaded FAISS index with IELTS vocabulary embeddings
 
-    Returns:
-        IELTSSuggestions with vocabulary suggestions, or empty suggestions on failure
+    Yields:
+        WordSuggestions with usage context (none for short conversations)
     """
     if not corrected_sentences:
-        return {"suggestions": []}
+        return
 
-    try:
-        # Step 1: Extract keywords using Claude Haiku
-        keywords = await extract_keywords(corrected_sentences)
-        logger.debug(f"Extracted keywords: {keywords}")
+    # Steps 1-2: Candidate keywords -> FAISS vocabulary matches
+    vocabulary_matches = await find_vocabulary_matches(
+        corrected_sentences, faiss_index)
+
+    # Step 3: Pick fitting suggestions and explain them (the one Haiku call)
+    async for suggestion in stream_usage_explanations(
+            vocabulary_matches, corrected_sentences):
+        yield suggestion
 
-        if not keywords["replaceable_words"]:
-            return {"suggestions": []}
 
-        # Step 2: Search FAISS index for vocabulary matches
-        vocabulary_matches = await search_ielts_vocabulary(keywords, faiss_index)
-        logger.debug(f"Found {len(vocabulary_matches)} vocabulary matches")
+async def run_ielts_rag_pipeline(
+    corrected_sentences: list[str],
+    faiss_index: FAISS,
+) -> IELTSSuggestions:
+    """
+    Main pipeline function that orchestrates the IELTS RAG workflow.
 
-        if not vocabulary_matches:
-            return {"suggestions": []}
+    Collects stream_ielts_rag_pipeline for callers that need the full list.
 
-        # Step 3: Generate usage context explanations
-        suggestions = await generate_usage_explanations(vocabulary_matches)
+    Args:
+        corrected_sentences: List of grammar-corrected sentences from conversation
+        faiss_index: Pre-loaded FAISS index with IELTS vocabulary embeddings
+
+    Returns:
+        IELTSSuggestions with vocabulary suggestions, or empty suggestions on failure
+    """
+    try:
+        suggestions = [
+            suggestion
+            async for suggestion in stream_ielts_rag_pipeline(
+                corrected_sentences, faiss_index)
+        ]
         logger.debug(
             f"Generated {len(suggestions)} suggestions with usage context")
-
         return {"suggestions": suggestions}
 
     except Exception as e:
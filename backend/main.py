@@ -4,13 +4,16 @@ English practice application with AI-powered conversation and grammar correction
 """
 
 import logging
+import os
 import sys
 from contextlib import asynccontextmanager
 
 from endpoints import router
-from dependencies import load_ielts_index
+from graph import open_checkpointer
+from dependencies import get_allowed_origins, init_graph, load_ielts_index
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from dotenv import load_dotenv
 load_dotenv()
 
@@ -31,33 +34,57 @@ async def lifespan(app: FastAPI):
     """
     Lifespan context manager for server startup/shutdown.
 
-    On startup: Load IELTS FAISS index into memory.
+    On startup: Open the checkpointer, compile the LangGraph workflow around
+    it, warm it, and load the IELTS FAISS index into memory so the first
+    request doesn't pay the cold-start cost. On shutdown the checkpointer
+    (e.g. its SQLite connection) is closed.
     """
-    # Startup: Load IELTS index
-    logger.info("Loading IELTS FAISS index...")
-    index = load_ielts_index()
-    if index is not None:
-        logger.info("IELTS FAISS index loaded successfully")
-    else:
-        logger.warning("IELTS FAISS index not available - suggestions will be disabled")
+    # Startup: Open the checkpointer; it stays open until shutdown
+    async with open_checkpointer() as checkpointer:
+        # Startup: Compile graph
+        logger.info("Compiling LangGraph workflow...")
+        graph = await init_graph(checkpointer)
+        logger.info("LangGraph workflow compiled")
 
-    yield
+        # Startup: Prime the checkpointer so the first request skips its open cost
+        try:
+            await graph.aget_state({"configurable": {"thread_id": "__warmup__"}})
+            logger.info("Checkpointer warmed up")
+        except Exception as e:
+            # A persistent checkpointer that can't serve reads would fail
+            # every request; refuse to start instead
+            if os.getenv("CHECKPOINT_DB"):
+                logger.error(f"Checkpointer warmup failed: {e}")
+                raise
+            logger.warning(f"Checkpointer warmup failed: {e}")
 
-    # Shutdown: cleanup (if needed)
-    logger.info("Server shutting down")
+        # Startup: Load IELTS index
+        logger.info("Loading IELTS FAISS index...")
+        index = await load_ielts_index()
+        if index is not None:
+            logger.info("IELTS FAISS index loaded successfully")
+        else:
+            logger.warning("IELTS FAISS index not available - suggestions will be disabled")
+
+        yield
+
+        # Shutdown: the checkpointer closes when this block exits
+        logger.info("Server shutting down")
 
 
 app = FastAPI(
     title="Speak Chat API",
     description="AI-powered English practice with real-time grammar corrections",
     version="0.1.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    # JSON bodies (/history, /summary, /health) are encoded with orjson
+    default_response_class=ORJSONResponse,
 )
 
 # CORS middleware configuration
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["http://localhost:5173"],  # Vite default port
+    allow_origins=get_allowed_origins(),
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
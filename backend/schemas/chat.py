@@ -2,11 +2,13 @@
 Schema definitions for chat endpoints.
 """
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class SummaryRequest(BaseModel):
     """Request model for summary endpoint"""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     thread_id: str
 
 
@@ -31,6 +33,14 @@ class SummaryResponse(BaseModel):
     ielts_suggestions: list[WordSuggestion] = []
 
 
+class SummaryBatchResponse(BaseModel):
+    """Response model for batched (non-interactive) summary tips and IELTS suggestions"""
+    batch_id: str | None = None  # None when tips were available without a batch
+    status: str  # Anthropic batch processing_status, or "ended"
+    tips: str | None = None  # Set once the batch has ended
+    ielts_suggestions: list[WordSuggestion] | None = None  # Set once the batch has ended
+
+
 class CorrectionInfo(BaseModel):
     """Correction data for history response"""
     original: str
@@ -6,14 +6,29 @@ Usage:
     cd backend && uv run python scripts/build_ielts_index.py
 """
 
-import json
+import asyncio
+import hashlib
+import os
+import shutil
 import time
+from itertools import chain
 from pathlib import Path
 
+import faiss
+import numpy as np
+import orjson
+from botocore.exceptions import ClientError
 from langchain_community.vectorstores import FAISS
+from langchain_community.vectorstores.utils import DistanceStrategy
 
 from dotenv import load_dotenv
 from langchain_aws import BedrockEmbeddings
+from tenacity import (
+    retry,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_random_exponential,
+)
 
 load_dotenv()
 
@@ -22,37 +37,66 @@ PROJECT_ROOT = Path(__file__).parent.parent.parent
 IELTS_JSON_PATH = PROJECT_ROOT / "IELTS.json"
 OUTPUT_DIR = Path(__file__).parent.parent / "data"
 FAISS_INDEX_DIR = OUTPUT_DIR / "ielts_index"
-PROGRESS_FILE = OUTPUT_DIR / "build_progress.json"
+# Embedded windows saved as they finish, so an interrupted build resumes
+# from the first missing one (removed once the index is saved)
+CHUNKS_DIR = OUTPUT_DIR / "chunks"
 
 # Titan embedding model (V2 for better multilingual support)
 EMBEDDING_MODEL_ID = "amazon.titan-embed-text-v2:0"
 
+# Vectors are L2-normalized, so inner product == cosine similarity and the
+# flat scan avoids the per-vector L2 distance computation
+DISTANCE_STRATEGY = DistanceStrategy.MAX_INNER_PRODUCT
+
 # Batch processing settings to avoid rate limiting
 BATCH_SIZE = 50
-DELAY_SECONDS = 1.0
 
+# Titan embeds one text per request; requests per minute allowed by the
+# account's Bedrock quota (throttled requests are retried with backoff)
+BEDROCK_RPM = int(os.getenv("BEDROCK_RPM", "2000"))
+MAX_THROTTLE_RETRIES = 6
+
+# Batches embedded concurrently per window; each window is saved as one chunk
+EMBED_CONCURRENCY = 8
+
+# Store vectors as FP16 once the index is complete (halves memory per query)
+QUANTIZE_FP16 = True
+
+# Build an HNSW graph index instead of a flat scan. Flat search is O(N) per
+# query and is still fast at ~10k words; switch this on once the word list
+# grows past ~100k. Scores stay exact inner products, so SCORE_THRESHOLD in
+# ielts_rag.py needs no retuning.
+BUILD_HNSW = False
+HNSW_M = 32  # Graph neighbours per vector
+HNSW_EF_CONSTRUCTION = 200
+
+# Build an inverted-file index with product-quantized codes instead: each
+# query scans only the closest lists (nprobe, see dependencies.py) and each
+# vector is stored in 32 bytes. Scores become approximate, so SCORE_THRESHOLD
+# in ielts_rag.py should be re-checked against a few queries when enabling it.
+# BUILD_HNSW takes precedence if both are set.
+BUILD_IVF_PQ = False
+IVF_PQ_FACTORY = "IVF256,PQ32"
 
-def load_progress() -> int:
-    """Load the number of already processed words."""
-    if PROGRESS_FILE.exists():
-        with open(PROGRESS_FILE, "r") as f:
-            data = json.load(f)
-            return data.get("processed_count", 0)
-    return 0
 
+def chunk_path(window_number: int, window_texts: list[str]) -> Path:
+    """
+    Get the file an embedded window is saved to.
 
-def save_progress(processed_count: int):
-    """Save the current progress."""
-    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-    with open(PROGRESS_FILE, "w") as f:
-        json.dump({"processed_count": processed_count}, f)
+    The name includes a hash of the window's texts (and the embedding model),
+    so a chunk saved before IELTS.json, the batch settings or the model
+    changed is never matched to different texts on resume.
+    """
+    digest = hashlib.blake2b(
+        "\n".join([EMBEDDING_MODEL_ID, *window_texts]).encode(), digest_size=8
+    ).hexdigest()
+    return CHUNKS_DIR / f"chunk_{window_number:05d}_{digest}.npy"
 
 
 def load_ielts_words() -> list[dict]:
     """Load IELTS word list from JSON file."""
     print(f"Loading IELTS words from {IELTS_JSON_PATH}...")
-    with open(IELTS_JSON_PATH, "r", encoding="utf-8") as f:
-        words = json.load(f)
+    words = orjson.loads(IELTS_JSON_PATH.read_bytes())
     print(f"Loaded {len(words)} words")
     return words
 
@@ -86,7 +130,218 @@ def create_metadata(word_entry: dict) -> dict:
     }
 
 
-def main():
+def quantize_to_fp16(vectorstore: FAISS) -> None:
+    """
+    Replace the flat FP32 index with an FP16 scalar-quantized index.
+
+    Flat search is memory-bandwidth bound, so halving the bytes per vector
+    roughly halves the cost per query with negligible recall loss.
+    """
+    flat_index = vectorstore.index
+    vectors = flat_index.reconstruct_n(0, flat_index.ntotal)
+
+    fp16_index = faiss.IndexScalarQuantizer(
+        flat_index.d,
+        faiss.ScalarQuantizer.QT_fp16,
+        flat_index.metric_type,
+    )
+    fp16_index.train(vectors)
+    fp16_index.add(vectors)
+
+    vectorstore.index = fp16_index
+
+
+def build_hnsw_index(vectorstore: FAISS) -> None:
+    """
+    Replace the flat index with an HNSW graph index over the same vectors.
+
+    Vectors are stored as FP16 when QUANTIZE_FP16 is set, like
+    quantize_to_fp16 does for the flat index.
+    """
+    flat_index = vectorstore.index
+    vectors = flat_index.reconstruct_n(0, flat_index.ntotal)
+
+    if QUANTIZE_FP16:
+        hnsw_index = faiss.IndexHNSWSQ(
+            flat_index.d,
+            faiss.ScalarQuantizer.QT_fp16,
+            HNSW_M,
+            flat_index.metric_type,
+        )
+        hnsw_index.train(vectors)
+    else:
+        hnsw_index = faiss.IndexHNSWFlat(
+            flat_index.d, HNSW_M, flat_index.metric_type)
+    hnsw_index.hnsw.efConstruction = HNSW_EF_CONSTRUCTION
+    hnsw_index.add(vectors)
+
+    vectorstore.index = hnsw_index
+
+
+def build_ivf_pq_index(vectorstore: FAISS) -> None:
+    """
+    Replace the flat index with an IVF-PQ index (IVF_PQ_FACTORY) over the
+    same vectors, trained on the vectors themselves.
+    """
+    flat_index = vectorstore.index
+    vectors = flat_index.reconstruct_n(0, flat_index.ntotal)
+
+    ivf_pq_index = faiss.index_factory(
+        flat_index.d, IVF_PQ_FACTORY, flat_index.metric_type)
+    ivf_pq_index.train(vectors)
+    ivf_pq_index.add(vectors)
+
+    vectorstore.index = ivf_pq_index
+
+
+def save_index(vectorstore: FAISS) -> None:
+    """
+    Save the index next to FAISS_INDEX_DIR, then swap it into place.
+
+    A build killed mid-save leaves the previous index intact instead of a
+    half-written one the server would fail to load.
+    """
+    tmp_dir = FAISS_INDEX_DIR.with_name(FAISS_INDEX_DIR.name + ".tmp")
+    old_dir = FAISS_INDEX_DIR.with_name(FAISS_INDEX_DIR.name + ".old")
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    vectorstore.save_local(str(tmp_dir))
+
+    # Directories can't be replaced over a non-empty one: move the old aside
+    if FAISS_INDEX_DIR.exists():
+        shutil.rmtree(old_dir, ignore_errors=True)
+        FAISS_INDEX_DIR.replace(old_dir)
+    tmp_dir.replace(FAISS_INDEX_DIR)
+    shutil.rmtree(old_dir, ignore_errors=True)
+
+
+class RequestRateLimiter:
+    """
+    Token bucket that spaces Bedrock requests to stay under a per-minute quota.
+
+    Tokens refill continuously at rpm / 60 per second, so requests go out as
+    fast as the quota allows instead of idling a fixed delay per batch.
+    """
+
+    def __init__(self, rpm: int, capacity: int):
+        self._rate = rpm / 60
+        self._capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, tokens: int) -> None:
+        """Wait until `tokens` requests can be sent (at most capacity)."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self._capacity, self._tokens + (now - self._updated) * self._rate)
+                self._updated = now
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                await asyncio.sleep((tokens - self._tokens) / self._rate)
+
+
+def is_throttled(error: BaseException) -> bool:
+    """Check whether a Bedrock error (possibly re-raised by LangChain) is a 429."""
+    for e in (error, error.__cause__, error.__context__):
+        if (isinstance(e, ClientError)
+                and e.response.get("Error", {}).get("Code") == "ThrottlingException"):
+            return True
+    return False
+
+
+@retry(
+    retry=retry_if_exception(is_throttled),
+    wait=wait_random_exponential(multiplier=1, max=60),
+    stop=stop_after_attempt(MAX_THROTTLE_RETRIES),
+    reraise=True,
+)
+async def embed_batch(
+    embeddings: BedrockEmbeddings,
+    limiter: RequestRateLimiter,
+    texts: list[str],
+) -> list[list[float]]:
+    """Embed one batch once the rate limiter allows its requests."""
+    await limiter.acquire(len(texts))
+    return await embeddings.aembed_documents(texts)
+
+
+async def embed_window(
+    embeddings: BedrockEmbeddings,
+    limiter: RequestRateLimiter,
+    texts: list[str],
+) -> list[list[float]]:
+    """
+    Embed a window of texts as concurrent BATCH_SIZE requests.
+
+    Embedding is network-bound, so the batches overlap instead of each one
+    waiting for the previous round trip.
+
+    Returns:
+        One vector per text, in the same order as texts
+    """
+    batch_vectors = await asyncio.gather(*(
+        embed_batch(embeddings, limiter, texts[i: i + BATCH_SIZE])
+        for i in range(0, len(texts), BATCH_SIZE)
+    ))
+    return list(chain.from_iterable(batch_vectors))
+
+
+async def gather_embeddings(
+    embeddings: BedrockEmbeddings,
+    limiter: RequestRateLimiter,
+    texts: list[str],
+) -> np.ndarray:
+    """
+    Embed every text, one window of concurrent batches at a time.
+
+    Each finished window is saved to CHUNKS_DIR (O(N) bytes written in
+    total); windows saved by an interrupted run are loaded instead of being
+    embedded again.
+
+    Texts are embedded shortest first, so each window's requests take about
+    as long as each other and one long entry doesn't hold up a window of
+    short ones. Chunks are in that sorted order.
+
+    Returns:
+        float32 array of shape (len(texts), dimension), in text order
+    """
+    CHUNKS_DIR.mkdir(parents=True, exist_ok=True)
+    window_size = BATCH_SIZE * EMBED_CONCURRENCY
+    total_windows = (len(texts) + window_size - 1) // window_size
+
+    order = np.argsort([len(t) for t in texts], kind="stable")
+    sorted_texts = [texts[i] for i in order]
+
+    windows = []
+    for window_number, i in enumerate(range(0, len(texts), window_size)):
+        window_texts = sorted_texts[i: i + window_size]
+        path = chunk_path(window_number, window_texts)
+        if path.exists():
+            windows.append(np.load(path))
+            continue
+
+        print(f"  Embedding window {window_number + 1}/{total_windows} "
+              f"({len(window_texts)} words)...", end=" ", flush=True)
+        vectors = np.asarray(
+            await embed_window(embeddings, limiter, window_texts), dtype=np.float32)
+        # Write then rename, so an interrupted save never leaves a partial chunk
+        partial_path = path.with_suffix(".partial.npy")
+        np.save(partial_path, vectors)
+        partial_path.replace(path)
+        windows.append(vectors)
+        print(f"done (saved: {min(i + window_size, len(texts))}/{len(texts)})")
+
+    # Back to text order, so docstore ids follow IELTS.json
+    sorted_vectors = np.concatenate(windows)
+    vectors = np.empty_like(sorted_vectors)
+    vectors[order] = sorted_vectors
+    return vectors
+
+
+async def main():
     start_time = time.time()
 
     # Load words
@@ -102,65 +357,52 @@ def main():
     embeddings = BedrockEmbeddings(
         model_id=EMBEDDING_MODEL_ID,
     )
+    limiter = RequestRateLimiter(BEDROCK_RPM, capacity=BATCH_SIZE)
 
-    # Check for existing progress
-    start_index = load_progress()
-    vectorstore = None
-
-    if start_index > 0 and FAISS_INDEX_DIR.exists():
-        print(f"Resuming from word {start_index}/{len(texts)}...")
-        vectorstore = FAISS.load_local(
-            str(FAISS_INDEX_DIR),
-            embeddings,
-            allow_dangerous_deserialization=True,
-        )
+    if CHUNKS_DIR.exists():
+        print(f"Resuming with embedded chunks from {CHUNKS_DIR}...")
     else:
-        start_index = 0
         print("Starting fresh...")
 
-    # Skip if already completed
-    if start_index >= len(texts):
-        print("All words already processed!")
-        return
-
-    # Calculate remaining batches
-    remaining_texts = texts[start_index:]
-    remaining_metadatas = metadatas[start_index:]
-    total_batches = (len(remaining_texts) + BATCH_SIZE - 1) // BATCH_SIZE
-    print(f"Processing {len(remaining_texts)} remaining words in {total_batches} batches...")
-
-    # Build FAISS index in batches to avoid rate limiting
-    for i in range(0, len(remaining_texts), BATCH_SIZE):
-        batch_num = i // BATCH_SIZE + 1
-        batch_texts = remaining_texts[i: i + BATCH_SIZE]
-        batch_metadatas = remaining_metadatas[i: i + BATCH_SIZE]
-
-        print(f"  Processing batch {batch_num}/{total_batches}...", end=" ", flush=True)
-
-        if vectorstore is None:
-            vectorstore = FAISS.from_texts(
-                texts=batch_texts,
-                embedding=embeddings,
-                metadatas=batch_metadatas,
-            )
-        else:
-            vectorstore.add_texts(texts=batch_texts, metadatas=batch_metadatas)
-
-        # Save progress after each batch
-        processed_count = start_index + i + len(batch_texts)
-        save_progress(processed_count)
-        vectorstore.save_local(str(FAISS_INDEX_DIR))
-
-        print(f"done (saved: {processed_count}/{len(texts)})")
-
-        # Delay between batches to avoid rate limiting (skip after last batch)
-        if i + BATCH_SIZE < len(remaining_texts):
-            time.sleep(DELAY_SECONDS)
-
-    # Clean up progress file when complete
-    if PROGRESS_FILE.exists():
-        PROGRESS_FILE.unlink()
-        print("Progress file cleaned up.")
+    # Embed each distinct text once (repeated entries give identical texts),
+    # then build the FAISS index once from the vectors
+    unique_texts = list(dict.fromkeys(texts))
+    total_batches = (len(unique_texts) + BATCH_SIZE - 1) // BATCH_SIZE
+    print(f"Embedding {len(unique_texts)} unique texts "
+          f"({len(texts)} words) in {total_batches} batches...")
+    unique_vectors = await gather_embeddings(embeddings, limiter, unique_texts)
+    row_of_text = {text: row for row, text in enumerate(unique_texts)}
+    vectors = unique_vectors[[row_of_text[text] for text in texts]]
+
+    print("Building FAISS index...", end=" ", flush=True)
+    vectorstore = FAISS.from_embeddings(
+        text_embeddings=list(zip(texts, vectors)),
+        embedding=embeddings,
+        metadatas=metadatas,
+        distance_strategy=DISTANCE_STRATEGY,
+        normalize_L2=True,
+    )
+    print("done")
+
+    # Compress the finished index
+    if BUILD_HNSW:
+        print("Building HNSW index...", end=" ", flush=True)
+        build_hnsw_index(vectorstore)
+        print("done")
+    elif BUILD_IVF_PQ:
+        print("Building IVF-PQ index...", end=" ", flush=True)
+        build_ivf_pq_index(vectorstore)
+        print("done")
+    elif QUANTIZE_FP16:
+        print("Quantizing index to FP16...", end=" ", flush=True)
+        quantize_to_fp16(vectorstore)
+        print("done")
+
+    save_index(vectorstore)
+
+    # Clean up embedded chunks once the index is saved
+    shutil.rmtree(CHUNKS_DIR)
+    print("Embedded chunks cleaned up.")
 
     elapsed_time = time.time() - start_time
     print(f"\nDone! Total time: {elapsed_time:.2f} seconds")
@@ -168,4 +410,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
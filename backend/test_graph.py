@@ -4,17 +4,24 @@ Run this to verify the graph executes correctly with sample inputs.
 """
 
 import asyncio
+from functools import lru_cache
 from langchain_core.messages import HumanMessage
 from graph import compile_graph, GraphState
 
 
+@lru_cache(maxsize=1)
+def get_graph():
+    """Get the compiled graph shared by every test (compiled on first use)."""
+    return compile_graph()
+
+
 async def test_graph_execution():
     """Test the graph with a sample user message."""
     print("🧪 Testing LangGraph workflow...\n")
 
     # Compile the graph
     print("📊 Compiling graph...")
-    graph = compile_graph()
+    graph = get_graph()
     print("✅ Graph compiled successfully\n")
 
     # Create initial state with a test message
@@ -27,10 +34,12 @@ async def test_graph_execution():
         "thread_id": "test_thread_123"
     }
 
-    # Configure thread for persistence
+    # Configure thread for persistence; TTS audio arrives via the audio sink
+    tts_results = []
     config = {
         "configurable": {
-            "thread_id": "test_thread_123"
+            "thread_id": "test_thread_123",
+            "audio_sink": lambda audio, audio_format: tts_results.append((audio, audio_format)),
         }
     }
 
@@ -54,11 +63,10 @@ async def test_graph_execution():
                     print(f"💭 Chat response: {messages[0].content[:100]}...")
 
             # Display TTS result if available
-            if "tts" in update:
-                tts_audio = update["tts"].get("tts_audio")
-                tts_format = update["tts"].get("tts_format")
-                if tts_audio:
-                    print(f"🔊 TTS audio generated: {len(tts_audio)} chars (base64), format: {tts_format}")
+            if "tts" in update or "chat_tts" in update:
+                if tts_results:
+                    tts_audio, tts_format = tts_results.pop()
+                    print(f"🔊 TTS audio generated: {len(tts_audio)} bytes, format: {tts_format}")
                 else:
                     print("🔊 TTS skipped (no audio generated)")
 
@@ -100,11 +108,17 @@ async def test_multiple_messages_in_thread():
     print("\n🧪 Testing multiple messages in same thread...\n")
 
     # Compile the graph
-    graph = compile_graph()
+    graph = get_graph()
 
     # Use same thread_id for both messages
     thread_id = "test_thread_multi"
-    config = {"configurable": {"thread_id": thread_id}}
+    tts_results = []
+    config = {
+        "configurable": {
+            "thread_id": thread_id,
+            "audio_sink": lambda audio, audio_format: tts_results.append((audio, audio_format)),
+        }
+    }
 
     messages = [
         "I go to store yesterday.",
@@ -123,10 +137,10 @@ async def test_multiple_messages_in_thread():
         tts_generated = False
 
         async for update in graph.astream(state, config, stream_mode="updates"):
-            if "tts" in update:
-                tts_audio = update["tts"].get("tts_audio")
-                if tts_audio:
-                    print(f"   🔊 Message {i} got TTS audio: {len(tts_audio)} chars")
+            if "tts" in update or "chat_tts" in update:
+                if tts_results:
+                    tts_audio, _ = tts_results.pop()
+                    print(f"   🔊 Message {i} got TTS audio: {len(tts_audio)} bytes")
                     tts_generated = True
                 else:
                     print(f"   🔊 Message {i} TTS skipped (no API key)")
@@ -140,6 +154,61 @@ async def test_multiple_messages_in_thread():
     print("Each message in thread gets its own TTS processing.\n")
 
 
+async def test_concurrent_threads():
+    """Test that messages in separate threads run concurrently and stay isolated."""
+    print("\n🧪 Testing concurrent messages in separate threads...\n")
+
+    # Compile the graph
+    graph = get_graph()
+
+    messages = [
+        "I go to store yesterday.",
+        "She don't like coffee.",
+        "We was at the park last weekend."
+    ]
+    thread_ids = [f"test_thread_concurrent_{i}" for i in range(1, len(messages) + 1)]
+
+    async def run_one(msg_content: str, thread_id: str) -> list[str]:
+        """Stream one message through its own thread, returning node order."""
+        state: GraphState = {
+            "messages": [HumanMessage(content=msg_content)],
+            "corrections": [],
+            "thread_id": thread_id
+        }
+        config = {
+            "configurable": {
+                "thread_id": thread_id,
+                "audio_sink": lambda audio, audio_format: None,
+            }
+        }
+
+        execution_order = []
+        async for update in graph.astream(state, config, stream_mode="updates"):
+            execution_order.extend(update.keys())
+        return execution_order
+
+    # Independent threads: wall-clock is the slowest run, not the sum
+    results = await asyncio.gather(*(
+        run_one(msg_content, thread_id)
+        for msg_content, thread_id in zip(messages, thread_ids)
+    ))
+
+    for i, (msg_content, thread_id, execution_order) in enumerate(
+            zip(messages, thread_ids, results), 1):
+        snapshot = await graph.aget_state({"configurable": {"thread_id": thread_id}})
+        human_messages = [
+            m.content for m in snapshot.values.get("messages", [])
+            if isinstance(m, HumanMessage)
+        ]
+        if human_messages == [msg_content]:
+            print(f"   ✅ Thread {i} isolated: {' → '.join(execution_order)}")
+        else:
+            print(f"   ❌ Thread {i} holds unexpected messages: {human_messages}")
+
+    print("\n✅ Concurrent thread test completed!")
+    print("Each thread keeps only its own conversation.\n")
+
+
 if __name__ == "__main__":
     # Check if .env file exists and has required API keys
     import os
@@ -168,3 +237,9 @@ if __name__ == "__main__":
     print("=" * 60)
 
     asyncio.run(test_multiple_messages_in_thread())
+
+    print("\n" + "=" * 60)
+    print("Concurrent Threads Test")
+    print("=" * 60)
+
+    asyncio.run(test_concurrent_threads())
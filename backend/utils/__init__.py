@@ -3,5 +3,6 @@ Utility functions for the Speak Chat API.
 """
 
 from utils.json_utils import strip_markdown_code_blocks
+from utils.message_utils import content_text
 
-__all__ = ["strip_markdown_code_blocks"]
+__all__ = ["content_text", "strip_markdown_code_blocks"]
@@ -20,11 +20,11 @@ def strip_markdown_code_blocks(content: str) -> str:
     Returns:
         The string with code block markers removed
     """
+    # Plain string methods: an opening ``` or ```json fence, the body, and an
+    # optional closing fence (may be cut off)
     content = content.strip()
-    if content.startswith("```json"):
-        content = content[7:]
-    if content.startswith("```"):
-        content = content[3:]
-    if content.endswith("```"):
-        content = content[:-3]
-    return content.strip()
+    if not content.startswith("```"):
+        # Fast path: no opening fence, nothing to strip but a stray closer
+        return content.removesuffix("```").rstrip()
+    body = content[3:].removeprefix("json")
+    return body.removesuffix("```").strip()
@@ -0,0 +1,23 @@
+"""
+Message utility functions.
+"""
+
+
+def content_text(content) -> str:
+    """
+    Get the text of a message (chunk) whose content may be a block list.
+
+    Anthropic replies are usually a plain string, but can be a list of
+    content blocks; only the text blocks are joined, so str(list) reprs
+    never leak into parsed or displayed text.
+
+    Args:
+        content: A LangChain message's content (str or list of blocks)
+
+    Returns:
+        The message text
+    """
+    if isinstance(content, str):
+        return content
+    return "".join(
+        block.get("text", "") for block in content if isinstance(block, dict))
@@ -1,40 +1,25 @@
-import { useState } from 'react'
 import { ChatProvider, useChat } from './context/ChatContext'
 import { useSSE } from './hooks/useSSE'
 import { useAudioPlayback } from './hooks/useAudioPlayback'
+import { useSummary } from './hooks/useSummary'
 import ChatContainer from './components/ChatContainer'
 import MessageInput from './components/MessageInput'
 import NewConversationButton from './components/NewConversationButton'
 import SummaryModal from './components/SummaryModal'
-import type { Summary } from './types'
 
 function ChatApp() {
-  const { loading, threadId, setLoading, clearThread } = useChat()
+  const { loading, threadId, clearThread } = useChat()
   const { playAudio } = useAudioPlayback()
   const { sendAudio, reconnectAttempts } = useSSE({
     onAudioChunk: (data) => {
       playAudio(data.audio)
     }
   })
-  const [summary, setSummary] = useState<Summary | null>(null)
+  const { summary, fetchSummary, clearSummary } = useSummary()
 
-  const handleOpenSummary = async () => {
+  const handleOpenSummary = () => {
     if (!threadId) return
-    setLoading('summary', true)
-    try {
-      const response = await fetch('http://localhost:8000/summary', {
-        method: 'POST',
-        headers: { 'Content-Type': 'application/json' },
-        body: JSON.stringify({ thread_id: threadId })
-      })
-      if (!response.ok) throw new Error(`HTTP error: ${response.status}`)
-      const data: Summary = await response.json()
-      setSummary(data)
-    } catch (error) {
-      console.error('Failed to fetch summary:', error)
-    } finally {
-      setLoading('summary', false)
-    }
+    fetchSummary(threadId)
   }
 
   const isInputDisabled = loading.chat || loading.correction
@@ -66,10 +51,11 @@ function ChatApp() {
       {summary && (
         <SummaryModal
           summary={summary}
+          isGenerating={loading.summary}
           onNewConversation={() => {
             clearThread()
             setTimeout(() => {
-              setSummary(null)
+              clearSummary()
             }, 100)
           }}
         />
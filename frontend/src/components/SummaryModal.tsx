@@ -4,11 +4,14 @@ import IELTSSuggestions from './IELTSSuggestions'
 
 interface SummaryModalProps {
   summary: Summary
+  /** Whether tips/suggestions are still streaming in */
+  isGenerating?: boolean
   onNewConversation: () => void
 }
 
 export default function SummaryModal({
   summary,
+  isGenerating = false,
   onNewConversation
 }: SummaryModalProps) {
   const [isClosing, setIsClosing] = useState(false)
@@ -85,6 +88,9 @@ export default function SummaryModal({
           <IELTSSuggestions suggestions={summary.ielts_suggestions} />
 
           {/* Part 3: AI-generated tips */}
+          {!summary.tips && isGenerating && (
+            <p className='text-gray-500 text-sm'>Generating tips…</p>
+          )}
           {summary.tips && (
             <section>
               <h3 className='text-sm font-medium text-gray-400 uppercase tracking-wide mb-2'>
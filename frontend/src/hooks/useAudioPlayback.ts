@@ -1,6 +1,6 @@
 /**
  * Custom hook for audio playback using Web Audio API.
- * Handles base64-encoded Opus audio decoding and playback.
+ * Handles Opus audio decoding and playback from base64 or raw bytes.
  */
 
 import { useRef, useCallback, useState, useEffect } from 'react'
@@ -17,8 +17,8 @@ interface UseAudioPlaybackConfig {
 
 /** Return type for the useAudioPlayback hook */
 interface UseAudioPlaybackReturn {
-  /** Play audio from base64-encoded data */
-  playAudio: (base64Audio: string) => Promise<void>
+  /** Play audio from base64-encoded data or raw bytes */
+  playAudio: (audio: string | ArrayBuffer) => Promise<void>
   /** Stop any currently playing audio */
   stopAudio: () => void
   /** Whether audio is currently playing */
@@ -114,9 +114,9 @@ export function useAudioPlayback(config: UseAudioPlaybackConfig = {}): UseAudioP
   }, [])
 
   /**
-   * Play audio from base64-encoded data
+   * Play audio from base64-encoded data or raw bytes
    */
-  const playAudio = useCallback(async (base64Audio: string): Promise<void> => {
+  const playAudio = useCallback(async (audio: string | ArrayBuffer): Promise<void> => {
     // Stop any currently playing audio
     stopAudio()
     setError(null)
@@ -139,8 +139,9 @@ export function useAudioPlayback(config: UseAudioPlaybackConfig = {}): UseAudioP
     }
 
     try {
-      // Convert base64 to ArrayBuffer
-      const arrayBuffer = base64ToArrayBuffer(base64Audio)
+      // Convert base64 to ArrayBuffer (binary WebSocket audio is already one)
+      const arrayBuffer =
+        typeof audio === 'string' ? base64ToArrayBuffer(audio) : audio
 
       // Decode audio data
       const audioBuffer = await context.decodeAudioData(arrayBuffer)
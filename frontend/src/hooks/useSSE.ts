@@ -10,7 +10,8 @@ import type {
   ThreadIdEventData,
   ChatResponseEventData,
   ErrorEventData,
-  AudioChunkEventData
+  AudioChunkEventData,
+  AudioFormatEventData
 } from '../types'
 
 /** Configuration for the useSSE hook */
@@ -44,6 +45,10 @@ const DEFAULT_CONFIG = {
   reconnectBaseDelay: 1000
 } as const
 
+/** URL of the audio WebSocket for a thread */
+const audioSocketUrl = (baseUrl: string, threadId: string) =>
+  `${baseUrl.replace(/^http/, 'ws')}/chat/ws/${threadId}`
+
 /**
  * Custom hook for managing SSE connections to the chat API.
  */
@@ -71,15 +76,68 @@ export function useSSE(config: UseSSEConfig = {}): UseSSEReturn {
   const isCompleteHandledRef = useRef<boolean>(false)
   const reconnectAttemptsRef = useRef(0)
   const threadIdRef = useRef(threadId)
+  const audioSocketRef = useRef<WebSocket | null>(null)
+  const audioFormatRef = useRef('opus')
+  const onAudioChunkRef = useRef(onAudioChunk)
 
   // State
   const [isConnected, setIsConnected] = useState(false)
   const [reconnectAttempts, setReconnectAttempts] = useState(0)
 
-  // Keep threadId ref in sync
+  // Keep threadId ref in sync; a cleared (new conversation) or switched
+  // thread closes the previous thread's audio WebSocket
   useEffect(() => {
     threadIdRef.current = threadId
-  }, [threadId])
+    const socket = audioSocketRef.current
+    if (socket && (!threadId || socket.url !== audioSocketUrl(baseUrl, threadId))) {
+      socket.close()
+      audioSocketRef.current = null
+    }
+  }, [threadId, baseUrl])
+
+  // Keep onAudioChunk ref in sync (used by the audio WebSocket)
+  useEffect(() => {
+    onAudioChunkRef.current = onAudioChunk
+  }, [onAudioChunk])
+
+  /**
+   * Open the audio WebSocket for a thread so TTS audio arrives as binary
+   * frames instead of base64 SSE events (SSE remains the fallback)
+   */
+  const connectAudioSocket = useCallback(
+    (threadId: string) => {
+      const url = audioSocketUrl(baseUrl, threadId)
+      const current = audioSocketRef.current
+      if (current && current.url === url && current.readyState <= WebSocket.OPEN) {
+        return
+      }
+      current?.close()
+
+      const socket = new WebSocket(url)
+      socket.binaryType = 'arraybuffer'
+      socket.onmessage = (event) => {
+        onAudioChunkRef.current?.({
+          audio: event.data as ArrayBuffer,
+          format: audioFormatRef.current
+        })
+      }
+      socket.onclose = () => {
+        if (audioSocketRef.current === socket) {
+          audioSocketRef.current = null
+        }
+      }
+      audioSocketRef.current = socket
+    },
+    [baseUrl]
+  )
+
+  // Close the audio WebSocket on unmount
+  useEffect(() => {
+    return () => {
+      audioSocketRef.current?.close()
+      audioSocketRef.current = null
+    }
+  }, [])
 
   /**
    * Clean up EventSource and timeout refs
@@ -146,6 +204,7 @@ export function useSSE(config: UseSSEConfig = {}): UseSSEReturn {
 
       const onThreadId = (data: ThreadIdEventData) => {
         setThreadId(data.thread_id)
+        connectAudioSocket(data.thread_id)
       }
 
       const onTranscription = (data: { text: string; timestamp?: number }) => {
@@ -155,6 +214,22 @@ export function useSSE(config: UseSSEConfig = {}): UseSSEReturn {
         }
       }
 
+      // Reply text streamed so far via chat_delta events
+      let streamedContent = ''
+
+      const onChatDelta = (data: ChatResponseEventData) => {
+        streamedContent += data.content
+        if (!currentMessageIdRef.current) {
+          currentMessageIdRef.current = addMessage({
+            role: 'assistant',
+            content: streamedContent
+          })
+          setLoading('chat', false)
+        } else {
+          updateMessageContent(currentMessageIdRef.current, streamedContent)
+        }
+      }
+
       const onChatResponse = (data: ChatResponseEventData) => {
         if (!currentMessageIdRef.current) {
           currentMessageIdRef.current = addMessage({
@@ -162,7 +237,7 @@ export function useSSE(config: UseSSEConfig = {}): UseSSEReturn {
             content: data.content
           })
         } else {
-          // Reserved for future streaming support (stream by token)
+          // Replace the streamed deltas with the final reply
           updateMessageContent(currentMessageIdRef.current, data.content)
         }
         setLoading('chat', false)
@@ -248,7 +323,11 @@ export function useSSE(config: UseSSEConfig = {}): UseSSEReturn {
 
                 if (currentEventType && currentData) {
                   try {
-                    const parsedData = JSON.parse(currentData)
+                    // audio_chunk data is raw base64, every other event is JSON
+                    const parsedData =
+                      currentEventType === 'audio_chunk'
+                        ? currentData
+                        : JSON.parse(currentData)
 
                     switch (currentEventType) {
                       case 'thread_id':
@@ -259,16 +338,27 @@ export function useSSE(config: UseSSEConfig = {}): UseSSEReturn {
                           parsedData as { text: string; timestamp?: number }
                         )
                         break
+                      case 'chat_delta':
+                        onChatDelta(parsedData as ChatResponseEventData)
+                        break
                       case 'chat_response':
                         onChatResponse(parsedData as ChatResponseEventData)
                         break
                       case 'correction':
                         onCorrection(parsedData as Correction)
                         break
+                      case 'audio_format':
+                        audioFormatRef.current = (
+                          parsedData as AudioFormatEventData
+                        ).format
+                        break
                       case 'audio_chunk':
                         // Handle audio chunk event - play audio without blocking text
                         if (onAudioChunk) {
-                          onAudioChunk(parsedData as AudioChunkEventData)
+                          onAudioChunk({
+                            audio: parsedData as string,
+                            format: audioFormatRef.current
+                          })
                         }
                         break
                       case 'error':
@@ -312,6 +402,7 @@ export function useSSE(config: UseSSEConfig = {}): UseSSEReturn {
       addMessage,
       updateMessageContent,
       attachCorrection,
+      connectAudioSocket,
       onAudioChunk
     ]
   )
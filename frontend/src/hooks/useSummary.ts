@@ -0,0 +1,178 @@
+/**
+ * Custom hook for fetching the practice summary.
+ * Streams the /summary endpoint so corrections render before the AI tips
+ * and IELTS suggestions are ready.
+ */
+
+import { useCallback, useEffect, useRef, useState } from 'react'
+import { useChat } from '../context/ChatContext'
+import type { Correction, Summary, WordSuggestion } from '../types'
+
+/** Configuration for the useSummary hook */
+interface UseSummaryConfig {
+  /** Base URL for the chat API (defaults to http://localhost:8000) */
+  baseUrl?: string
+}
+
+/** Return type for the useSummary hook */
+interface UseSummaryReturn {
+  /** Current summary (null until the first event arrives) */
+  summary: Summary | null
+  /** Stream the summary for a thread */
+  fetchSummary: (threadId: string) => Promise<void>
+  /** Clear the current summary */
+  clearSummary: () => void
+}
+
+/** Default configuration values */
+const DEFAULT_CONFIG = {
+  baseUrl: 'http://localhost:8000'
+} as const
+
+/**
+ * Custom hook for streaming the practice summary.
+ */
+export function useSummary(config: UseSummaryConfig = {}): UseSummaryReturn {
+  const { baseUrl } = { ...DEFAULT_CONFIG, ...config }
+  const { setLoading } = useChat()
+  const [summary, setSummary] = useState<Summary | null>(null)
+  // Controller for the in-flight stream; aborted when it is superseded,
+  // cleared or the component unmounts
+  const abortRef = useRef<AbortController | null>(null)
+
+  const fetchSummary = useCallback(
+    async (threadId: string) => {
+      abortRef.current?.abort()
+      const controller = new AbortController()
+      abortRef.current = controller
+      const { signal } = controller
+
+      setLoading('summary', true)
+
+      const mergeSummary = (part: Partial<Summary>) => {
+        setSummary((prev) => ({
+          corrections: [],
+          tips: '',
+          ielts_suggestions: [],
+          ...prev,
+          ...part
+        }))
+      }
+
+      try {
+        const response = await fetch(`${baseUrl}/summary`, {
+          method: 'POST',
+          headers: {
+            'Content-Type': 'application/json',
+            Accept: 'text/event-stream'
+          },
+          body: JSON.stringify({ thread_id: threadId }),
+          signal
+        })
+        if (!response.ok) throw new Error(`HTTP error: ${response.status}`)
+
+        const reader = response.body?.getReader()
+        if (!reader) throw new Error('No response body')
+
+        const decoder = new TextDecoder()
+        let buffer = ''
+        let currentEventType = ''
+
+        while (true) {
+          const { done, value } = await reader.read()
+          if (done || signal.aborted) break
+
+          buffer += decoder.decode(value, { stream: true })
+
+          const lines = buffer.split('\n')
+          buffer = lines.pop() || ''
+
+          for (const line of lines) {
+            if (line.startsWith('event:')) {
+              currentEventType = line.slice(6).trim()
+            } else if (line.startsWith('data:') && currentEventType) {
+              // Drop events from a stream that was aborted mid-chunk
+              if (signal.aborted) break
+              try {
+                const parsedData = JSON.parse(line.slice(5).trim())
+
+                switch (currentEventType) {
+                  case 'corrections':
+                    mergeSummary({
+                      corrections: parsedData.corrections as Correction[]
+                    })
+                    break
+                  case 'tips_delta':
+                    setSummary((prev) => ({
+                      corrections: [],
+                      ielts_suggestions: [],
+                      ...prev,
+                      tips: (prev?.tips ?? '') + (parsedData.delta as string)
+                    }))
+                    break
+                  case 'tips':
+                    mergeSummary({ tips: parsedData.tips as string })
+                    break
+                  case 'ielts_suggestion':
+                    setSummary((prev) => ({
+                      corrections: [],
+                      tips: '',
+                      ...prev,
+                      ielts_suggestions: [
+                        ...(prev?.ielts_suggestions ?? []),
+                        parsedData.suggestion as WordSuggestion
+                      ]
+                    }))
+                    break
+                  case 'ielts_suggestions':
+                    mergeSummary({
+                      ielts_suggestions:
+                        parsedData.ielts_suggestions as WordSuggestion[]
+                    })
+                    break
+                  case 'error':
+                    mergeSummary({ tips: parsedData.message as string })
+                    break
+                }
+              } catch (parseError) {
+                console.error('Failed to parse summary data:', parseError)
+              }
+              currentEventType = ''
+            } else if (line === '') {
+              currentEventType = ''
+            }
+          }
+        }
+      } catch (error) {
+        if (!signal.aborted) console.error('Failed to fetch summary:', error)
+      } finally {
+        // A superseding fetch owns the loading flag now
+        if (abortRef.current === controller) {
+          abortRef.current = null
+          setLoading('summary', false)
+        }
+      }
+    },
+    [baseUrl, setLoading]
+  )
+
+  const clearSummary = useCallback(() => {
+    if (abortRef.current) {
+      abortRef.current.abort()
+      abortRef.current = null
+      setLoading('summary', false)
+    }
+    setSummary(null)
+  }, [setLoading])
+
+  // Abort the in-flight stream on unmount
+  useEffect(() => () => abortRef.current?.abort(), [])
+
+  return {
+    summary,
+    fetchSummary,
+    clearSummary
+  }
+}
+
+export default useSummary
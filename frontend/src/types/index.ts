@@ -54,6 +54,7 @@ export interface LoadingState {
  */
 export type SSEEventType =
   | 'thread_id'
+  | 'chat_delta'
   | 'chat_response'
   | 'correction'
   | 'error'
@@ -97,12 +98,20 @@ export interface ErrorEventData {
   message: string
 }
 
+/**
+ * Audio format event data (sent before audio_chunk events)
+ */
+export interface AudioFormatEventData {
+  /** Audio format (e.g., 'opus') */
+  format: string
+}
+
 /**
  * Audio chunk event data (TTS audio)
  */
 export interface AudioChunkEventData {
-  /** Base64-encoded audio data */
-  audio: string
+  /** Base64-encoded audio data (SSE), or raw bytes (audio WebSocket) */
+  audio: string | ArrayBuffer
   /** Audio format (e.g., 'opus') */
   format: string
 }